@@ -0,0 +1,230 @@
+"""
+Authentication utilities for NewsFrontier backend.
+Handles password hashing, JWT issuing/decoding and the auth dependencies.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+import jwt
+import orjson
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from passlib.context import CryptContext
+
+from newsfrontier_lib import crud
+from newsfrontier_lib.database import get_session_async
+
+security = HTTPBearer(auto_error=False)  # Don't auto-error if no header
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Kept as bytes so PyJWT doesn't re-encode the key on every sign/verify
+SECRET_KEY = os.getenv("JWT_SECRET", "your-secret-key-here").encode("utf-8")
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_HOURS = 24
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_HOURS * 3600
+# Every token we issue carries exp and sub; reject anything that doesn't
+JWT_DECODE_OPTIONS = {"verify_signature": True, "require": ["exp", "sub"]}
+# One codec with the decode options bound up front, reused for every token
+_jwt = jwt.PyJWT(options=JWT_DECODE_OPTIONS)
+# Accepted algorithms, built once rather than as a fresh list per decode
+_JWT_ALGORITHMS = [ALGORITHM]
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 signing state prepared once: the encoded header never changes and the
+# keyed HMAC is copied per token instead of re-deriving its pads from the key
+_JWT_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_jwt_hmac = hmac.new(SECRET_KEY, digestmod=hashlib.sha256)
+
+
+class TokenClaims(NamedTuple):
+    """Claims read from a verified access token."""
+    username: str
+    expires_at: int
+    user_id: Optional[int]
+    is_admin: Optional[bool]
+
+
+class CurrentUser(NamedTuple):
+    """Read-only snapshot of the authenticated user's row, safe to share across requests."""
+    id: int
+    username: str
+    email: str
+    is_admin: bool
+    credits: int
+    credits_accrual: int
+    daily_summary_prompt: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+class AdminUser(NamedTuple):
+    """Identity of a user verified as admin against the cached user snapshot."""
+    id: int
+    username: str
+
+
+# (epoch second, formatted string) of the last timestamp rendered
+_last_iso = (0, "")
+
+
+def utc_isoformat_cached(epoch_seconds: int) -> str:
+    """Format a UTC epoch second as ISO-8601 with a Z suffix, reusing the previous result."""
+    global _last_iso
+    cached = _last_iso
+    if cached[0] != epoch_seconds:
+        cached = (epoch_seconds, datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).replace(tzinfo=None).isoformat() + "Z")
+        _last_iso = cached
+    return cached[1]
+
+
+def create_access_token(data: dict, expires_at: Optional[int] = None):
+    to_encode = data.copy()
+    # exp is plain epoch seconds; no datetime round-trip needed
+    if expires_at is None:
+        expires_at = int(time.time()) + ACCESS_TOKEN_EXPIRE_SECONDS
+    to_encode["exp"] = expires_at
+
+    signing_input = _JWT_HEADER_SEGMENT + b"." + _b64url(orjson.dumps(to_encode))
+    signature = _jwt_hmac.copy()
+    signature.update(signing_input)
+    return (signing_input + b"." + _b64url(signature.digest())).decode("ascii")
+
+
+# Decoded claims keyed by sha256(token), so bursts of requests with the same
+# token skip the HMAC check and JSON parse. Entries live for 30 seconds.
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+# Tokens seen at logout, kept for as long as any token can stay valid. This is
+# per process: other API workers keep accepting the token until it expires, so
+# treat it as best-effort and not as revocation.
+_logged_out_tokens = TTLCache(maxsize=100000, ttl=ACCESS_TOKEN_EXPIRE_SECONDS)
+# Sync dependencies run in the threadpool and TTLCache is not thread-safe
+_token_cache_lock = threading.Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _decode_token_cached(token: str) -> TokenClaims:
+    """Decode a JWT, reusing recently decoded claims for the same token."""
+    key = _token_key(token)
+    with _token_cache_lock:
+        if key in _logged_out_tokens:
+            raise jwt.InvalidTokenError("Token was logged out")
+        claims = _token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    payload = _jwt.decode(token, SECRET_KEY, algorithms=_JWT_ALGORITHMS)
+    # uid/adm are absent on tokens issued before they were added
+    claims = TokenClaims(payload["sub"], payload["exp"], payload.get("uid"), payload.get("adm"))
+    with _token_cache_lock:
+        _token_cache[key] = claims
+    return claims
+
+
+def forget_logged_out_token(token: str):
+    """Best-effort logout: stop accepting a token in this worker process only.
+
+    Tokens are stateless JWTs, so other workers still accept the token until it
+    expires. Clearing the auth cookie is what actually signs the browser out.
+    """
+    key = _token_key(token)
+    with _token_cache_lock:
+        _token_cache.pop(key, None)
+        _logged_out_tokens[key] = True
+
+
+# User snapshots keyed by username; saves the users lookup on most authenticated requests
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_user(username: str):
+    """Drop a cached user snapshot after the user's row changes."""
+    with _user_cache_lock:
+        _user_cache.pop(username, None)
+
+
+def get_request_token(request: Request, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[str]:
+    token = None
+
+    # First try to get token from Authorization header
+    if credentials:
+        token = credentials.credentials
+    else:
+        # If no Authorization header, try to get token from cookie
+        token = request.cookies.get("auth_token")
+
+    return token
+
+
+def verify_token_claims(token: Optional[str] = Depends(get_request_token)) -> TokenClaims:
+    if not token:
+        raise HTTPException(status_code=401, detail="No authentication token provided")
+
+    try:
+        claims = _decode_token_cached(token)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    # Cached entries can outlive the token itself, so re-check expiry
+    if claims.expires_at <= time.time():
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    return claims
+
+
+def verify_token(claims: TokenClaims = Depends(verify_token_claims)) -> str:
+    return claims.username
+
+
+def get_current_user_obj(username: str = Depends(verify_token), db = Depends(get_session_async)) -> CurrentUser:
+    """Resolve the authenticated user, serving repeat requests from a short-lived cache."""
+    with _user_cache_lock:
+        cached = _user_cache.get(username)
+    if cached is not None:
+        return cached
+
+    user = crud.user.get_by_username(db, username=username)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # Snapshot plain values; ORM instances are bound to this request's session
+    current_user = CurrentUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_admin=user.is_admin,
+        credits=user.credits,
+        credits_accrual=user.credits_accrual,
+        daily_summary_prompt=user.daily_summary_prompt,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
+    with _user_cache_lock:
+        _user_cache[username] = current_user
+    return current_user
+
+
+def verify_admin(user: CurrentUser = Depends(get_current_user_obj)) -> AdminUser:
+    """Verify that the authenticated user is an admin."""
+    # Read the admin bit from the short-lived user snapshot rather than the token
+    # claims, so demoting or deleting a user takes effect within the cache TTL
+    # instead of lasting for the token's lifetime
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return AdminUser(id=user.id, username=user.username)
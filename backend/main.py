@@ -1,39 +1,63 @@
-from fastapi import FastAPI, HTTPException, Depends, status, Response, Request
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, HTTPException, Depends, status, Response, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime, timedelta, date
 from uuid import UUID
-import jwt
-from passlib.context import CryptContext
+import atexit
+import base64
+from calendar import monthrange
 import json
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 import traceback
 import hashlib
+import threading
+import httpx
 import numpy as np
+import orjson
 import os
-import requests
-from text_processor import process_text_with_anchors, extract_paragraphs_with_anchors, get_text_processing_info
+from cachetools import TTLCache
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    FAISS_AVAILABLE = False
+from text_processor import process_text_with_anchors, process_text_with_anchors_cached, extract_paragraphs_with_anchors, get_text_processing_info
 
 # Import database and models
 try:
-    from newsfrontier_lib.database import get_session
+    from newsfrontier_lib.database import get_session, get_session_async, get_default_session_maker
     from newsfrontier_lib import crud
     from newsfrontier_lib.models import (
         User as UserModel, RSSFeed as RSSFeedModel, 
-        RSSItemMetadata, RSSFetchRecord, Event, ArticleEvent, Topic, ArticleTopic, 
-        RSSSubscription
+        RSSItemMetadata, RSSFetchRecord, RSSItemDerivative, Event, ArticleEvent, Topic, ArticleTopic, 
+        RSSSubscription, UserSummary
     )
-    from sqlalchemy import func
+    from sqlalchemy import and_, func, text, tuple_, literal_column
+    from sqlalchemy.orm import joinedload, selectinload
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from sqlalchemy.exc import IntegrityError
     from newsfrontier_lib.schemas import (
         RSSFeedCreate, RSSFeedUpdate, RSSFeedResponse,
         RSSSubscriptionCreate, RSSSubscriptionUpdate, RSSSubscriptionResponse,
         RSSItemResponse, TopicCreate, TopicUpdate, TopicResponse,
         EventResponse, UserSummaryResponse, UserResponse
     )
-    from newsfrontier_lib import generate_topic_embedding as lib_generate_topic_embedding
+    from newsfrontier_lib import generate_topic_embedding as lib_generate_topic_embedding, generate_content_embedding, normalize_embedding, decode_embedding, pack_embedding_matrix
+    from auth import (
+        pwd_context, ACCESS_TOKEN_EXPIRE_SECONDS,
+        create_access_token, utc_isoformat_cached, get_request_token, forget_logged_out_token,
+        verify_token, verify_admin,
+        CurrentUser, get_current_user_obj, invalidate_cached_user
+    )
     print("✅ Database modules imported successfully")
 except ImportError as e:
     print(f"❌ Database import failed: {e}")
@@ -44,36 +68,71 @@ except Exception as e:
     print(f"Full traceback: {traceback.format_exc()}")
     sys.exit(1)
 
-# Configure logging
+# Configure logging. Records go through a queue and a listener thread does
+# the file/stdout writes, so request handling never blocks on log I/O.
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_file_handler = logging.FileHandler('server.log')
+log_file_handler.setFormatter(log_formatter)
+log_stream_handler = logging.StreamHandler(sys.stdout)
+log_stream_handler.setFormatter(log_formatter)
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, log_file_handler, log_stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('server.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    level=os.getenv("LOG_LEVEL", "DEBUG").upper(),
+    format='%(message)s',  # the listener's handlers apply the real format
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="NewsFrontier API", version="0.1.0")
+app = FastAPI(
+    title="NewsFrontier API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse  # Serialize responses with orjson instead of stdlib json
+)
 
-# Add logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = datetime.utcnow()
-    logger.info(f"Incoming request: {request.method} {request.url}")
+# Add logging middleware (plain ASGI; avoids BaseHTTPMiddleware's per-request overhead)
+class LogMiddleware:
+    def __init__(self, app):
+        self.app = app
     
-    try:
-        response = await call_next(request)
-        process_time = (datetime.utcnow() - start_time).total_seconds()
-        logger.info(f"Request completed: {request.method} {request.url} - Status: {response.status_code} - Time: {process_time:.3f}s")
-        return response
-    except Exception as e:
-        process_time = (datetime.utcnow() - start_time).total_seconds()
-        logger.error(f"Request failed: {request.method} {request.url} - Error: {str(e)} - Time: {process_time:.3f}s")
-        logger.error(f"Stack trace: {traceback.format_exc()}")
-        raise
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        path = scope["path"]
+        if scope.get("query_string"):
+            path = f"{path}?{scope['query_string'].decode('latin-1')}"
+        # Skip the per-request records entirely when INFO is filtered out
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Incoming request: %s %s", method, path)
+        
+        status_code = 500
+        start_time = time.perf_counter()
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = time.perf_counter() - start_time
+            logger.error("Request failed: %s %s - Error: %s - Time: %.3fs", method, path, e, process_time)
+            logger.error("Stack trace: %s", traceback.format_exc())
+            raise
+        if log_info:
+            process_time = time.perf_counter() - start_time
+            logger.info("Request completed: %s %s - Status: %d - Time: %.3fs", method, path, status_code, process_time)
+
+app.add_middleware(LogMiddleware)
 
 # Add global exception handler
 @app.exception_handler(Exception)
@@ -85,6 +144,9 @@ async def global_exception_handler(request: Request, exc: Exception):
     
     return HTTPException(status_code=500, detail="Internal server error")
 
+# Article lists and summaries are multi-KB JSON; compress anything over 1KB
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -93,16 +155,187 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-security = HTTPBearer(auto_error=False)  # Don't auto-error if no header
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Shared keep-alive client for calls to the postprocess service; closed on shutdown
+postprocess_client = httpx.AsyncClient(
+    base_url=os.getenv("POSTPROCESS_URL", "http://localhost:8001"),
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+class CircuitBreaker:
+    """
+    Fail fast on calls to a service that keeps failing.
+    
+    After fail_max consecutive transport errors the breaker opens and calls raise
+    CircuitOpenError immediately. Once reset_timeout seconds have passed, a single
+    trial call is let through (half-open): success closes the breaker, another
+    failure re-opens it. Only used from the event loop, so no locking is needed.
+    """
+    
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 10):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+    
+    async def call(self, func, *args, **kwargs):
+        if self.opened_at is not None:
+            if self.trial_in_flight or time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit is open; not calling the service")
+            self.trial_in_flight = True
+        
+        try:
+            result = await func(*args, **kwargs)
+        except httpx.HTTPError:
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.fail_max:
+                if self.opened_at is None:
+                    logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+            raise
+        finally:
+            self.trial_in_flight = False
+        
+        if self.opened_at is not None:
+            logger.info(f"{self.name} circuit closed; service is responding again")
+        self.failures = 0
+        self.opened_at = None
+        return result
 
-SECRET_KEY = "your-secret-key-here"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_HOURS = 24
+postprocess_breaker = CircuitBreaker("postprocess")
 
 # AI Configuration (kept for backward compatibility)
 EMBEDDING_DIMENSION = int(os.getenv('EMBEDDING_DIMENSION', 1536))
 
+# Stored timestamps are naive UTC; orjson writes them as RFC 3339 with a "Z"
+# suffix, so handlers can put datetimes in payloads without formatting them
+ORJSON_UTC_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+class UTCORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders naive datetimes as UTC with a Z suffix."""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | ORJSON_UTC_OPTIONS)
+
+# Handlers that build their own typed response models pass response_model=None
+# and document the schema via `responses=` so FastAPI skips re-validating the
+# outgoing object while the OpenAPI schema stays intact.
+
+def encode_json_with_etag(payload: Any) -> tuple:
+    """Serialize a payload with orjson and derive a weak ETag from the bytes."""
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump()
+    body = orjson.dumps(payload, option=ORJSON_UTC_OPTIONS)
+    return body, f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_body_response(request: Request, body: bytes, etag: str) -> Response:
+    """Send pre-serialized JSON, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """Serialize a response once with orjson and answer 304 if the client already has it."""
+    return etag_body_response(request, *encode_json_with_etag(payload))
+
+def embedding_matrix_response(rows: List[tuple]) -> Response:
+    """Send (id, embedding) rows as raw float32 bytes instead of JSON number lists."""
+    rows = [(row_id, embedding) for row_id, embedding in rows if embedding is not None]
+    return Response(
+        content=pack_embedding_matrix([row_id for row_id, _ in rows], [embedding for _, embedding in rows]),
+        media_type="application/octet-stream",
+        headers={
+            "X-Embedding-Count": str(len(rows)),
+            "X-Embedding-Dimensions": str(len(rows[0][1]) if rows else 0)
+        }
+    )
+
+# Serialized article read responses as (body, etag), keyed by (view, article_id).
+# The cache is per process: writes drop entries only in the worker that handled
+# them, so other workers can serve a response up to the TTL (60s) old. That is
+# accepted for completed articles; detail responses for articles still being
+# processed are not cached, since those change as postprocess reports back.
+_article_response_cache = TTLCache(maxsize=4096, ttl=60)
+_article_response_cache_lock = threading.Lock()
+ARTICLE_RESPONSE_VIEWS = ("detail", "sentences", "processing-info")
+
+def get_cached_article_response(view: str, article_id: int) -> Optional[tuple]:
+    with _article_response_cache_lock:
+        return _article_response_cache.get((view, article_id))
+
+def cache_article_response(view: str, article_id: int, payload: Any) -> tuple:
+    body_and_etag = encode_json_with_etag(payload)
+    with _article_response_cache_lock:
+        _article_response_cache[(view, article_id)] = body_and_etag
+    return body_and_etag
+
+def invalidate_article_responses(article_id: int):
+    """Drop cached read responses after an article or its derivatives change."""
+    with _article_response_cache_lock:
+        for view in ARTICLE_RESPONSE_VIEWS:
+            _article_response_cache.pop((view, article_id), None)
+
+# Stacked topic vectors for /api/internal/topics/similar, keyed by user_id (None for
+# the all-topics lookup) as (topic rows, unit-normalized float32 matrix, faiss index or
+# None). Topic writes through this process drop the entries; other workers catch up
+# within the TTL.
+_topic_matrix_cache = TTLCache(maxsize=1024, ttl=300)
+_topic_matrix_cache_lock = threading.Lock()
+
+def get_topic_matrix(db, user_id: Optional[int]) -> tuple:
+    with _topic_matrix_cache_lock:
+        cached = _topic_matrix_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    topics = crud.topic.user_topics_query(
+        db, Topic.id, Topic.name, Topic.user_id, Topic.is_active, Topic.topic_vector, user_id=user_id
+    )
+
+    rows = []
+    vectors = []
+    for topic in topics:
+        if topic.topic_vector is not None:
+            rows.append((topic.id, topic.name, topic.user_id, topic.is_active))
+            vectors.append(topic.topic_vector)
+
+    matrix = None
+    if vectors:
+        matrix = np.ascontiguousarray(np.stack(vectors), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1)
+        # Zero vectors have no direction and can never match
+        nonzero = norms > 0
+        if not nonzero.all():
+            rows = [row for row, keep in zip(rows, nonzero) if keep]
+            matrix = matrix[nonzero]
+            norms = norms[nonzero]
+        matrix /= norms[:, None]
+        if not rows:
+            matrix = None
+
+    # With faiss installed, an inner-product index over the unit vectors does the
+    # scoring in its SIMD kernels; positions in the index line up with rows
+    index = None
+    if FAISS_AVAILABLE and matrix is not None:
+        index = faiss.IndexFlatIP(matrix.shape[1])
+        index.add(matrix)
+
+    cached = (rows, matrix, index)
+    with _topic_matrix_cache_lock:
+        _topic_matrix_cache[user_id] = cached
+    return cached
+
+def invalidate_topic_matrix(user_id: int):
+    """Drop cached topic vectors after one of the user's topics changes."""
+    with _topic_matrix_cache_lock:
+        _topic_matrix_cache.pop(user_id, None)
+        _topic_matrix_cache.pop(None, None)
+
 # Removed fake_users_db - now using database operations
 
 # Removed fake_articles_db - now using database operations with RSS items
@@ -165,6 +398,8 @@ class UserListResponse(BaseModel):
     daily_summary_prompt: Optional[str]
 
 class TopicDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     name: str
     keywords: List[str]
@@ -191,6 +426,8 @@ class User(BaseModel):
     updated_at: str
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     username: str
     email: str
@@ -218,6 +455,8 @@ class ArticleDerivative(BaseModel):
     processing_status: str = "pending"
 
 class Article(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     title: str
     content: Optional[str] = None
@@ -238,9 +477,10 @@ class ArticleList(BaseModel):
 class PaginationInfo(BaseModel):
     page: int
     limit: int
-    total: int
+    total: Optional[int] = None  # not computed when paging by cursor
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 class ArticlesResponse(BaseModel):
     data: List[Article]
@@ -265,10 +505,13 @@ class SystemSettingResponse(BaseModel):
     updated_at: str
     created_at: str
 
+# Mirrors check_setting_type_valid on system_settings
+SettingType = Literal['string', 'integer', 'boolean', 'json', 'float']
+
 class SystemSettingUpdate(BaseModel):
     setting_key: str
     setting_value: str
-    setting_type: str
+    setting_type: SettingType
 
 # Internal API BaseModel classes
 class FeedStatusUpdate(BaseModel):
@@ -285,6 +528,10 @@ class FeedFetchData(BaseModel):
 
 class ArticleProcessingUpdate(BaseModel):
     title_embedding: Optional[List[float]] = None
+    # base64 float16 form sent by current postprocess builds; a quarter of the JSON float list
+    title_embedding_b64: Optional[str] = None
+    summary_embedding: Optional[List[float]] = None
+    summary_embedding_b64: Optional[str] = None
     embedding_model: Optional[str] = None
     summary: Optional[str] = None
     summary_model: Optional[str] = None
@@ -316,69 +563,61 @@ class ArticleEventData(BaseModel):
     event_id: int
     relevance_score: Optional[float] = None
 
-def create_access_token(data: dict):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+# Unit-length embeddings keyed by a digest of the kind of input and its text, so
+# repeated topic names and event descriptions skip the embedding model call
+_embedding_cache = TTLCache(maxsize=2048, ttl=86400)
+_embedding_cache_lock = threading.Lock()
 
-def verify_token(request: Request, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)):
-    token = None
-    
-    # First try to get token from Authorization header
-    if credentials:
-        token = credentials.credentials
-    else:
-        # If no Authorization header, try to get token from cookie
-        token = request.cookies.get("auth_token")
-    
-    if not token:
-        raise HTTPException(status_code=401, detail="No authentication token provided")
-    
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return username
-    except jwt.PyJWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-def verify_admin(username: str = Depends(verify_token), db = Depends(get_session)):
-    """Verify that the authenticated user is an admin."""
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    if not user.is_admin:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    return user
+def embedding_cache_key(kind: str, *parts: str) -> bytes:
+    return hashlib.blake2b("\x00".join((kind, *parts)).encode("utf-8"), digest_size=16).digest()
+
+def get_cached_embedding(key: bytes) -> Optional[np.ndarray]:
+    with _embedding_cache_lock:
+        return _embedding_cache.get(key)
+
+def cache_embedding(key: bytes, embedding: np.ndarray):
+    with _embedding_cache_lock:
+        _embedding_cache[key] = embedding
 
 def generate_topic_embedding(topic_name: str) -> Optional[List[float]]:
     """Generate embedding for a topic name using the shared LLM library."""
+    cache_key = embedding_cache_key("topic", topic_name)
+    cached = get_cached_embedding(cache_key)
+    if cached is not None:
+        return cached.tolist()
+    
     try:
         embedding = lib_generate_topic_embedding(topic_name)
         if embedding:
             logger.info(f"Generated embedding for topic '{topic_name}': {len(embedding)} dimensions")
+            # Stored at unit length like every other embedding
+            unit_embedding = normalize_embedding(embedding)
+            cache_embedding(cache_key, unit_embedding)
+            embedding = unit_embedding.tolist()
         return embedding
     except Exception as e:
         logger.error(f"Embedding generation failed for topic '{topic_name}': {e}")
         return None
 
-@app.post("/api/login", response_model=LoginResponse)
-async def login(request: LoginRequest, response: Response, db = Depends(get_session)):
+@app.post("/api/login", response_model=None, responses={200: {"model": LoginResponse}})
+def login(request: LoginRequest, response: Response, db = Depends(get_session_async)):
     logger.info(f"Login attempt for user: {request.username}")
     
     
     # Get user from database
     user = crud.user.get_by_username(db, username=request.username)
+    
     if not user or not pwd_context.verify(request.password, user.password_hash):
         logger.warning(f"Failed login attempt for user: {request.username}")
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    access_token = create_access_token(data={"sub": request.username})
-    expires = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+    # Compute the expiry once and share it between the token and the response
+    expires_at = int(time.time()) + ACCESS_TOKEN_EXPIRE_SECONDS
+    # Carry the user id and admin bit as signed claims so admin checks skip the DB
+    access_token = create_access_token(
+        data={"sub": request.username, "uid": user.id, "adm": user.is_admin},
+        expires_at=expires_at
+    )
     
     # Set HTTP-only cookie
     response.set_cookie(
@@ -387,30 +626,32 @@ async def login(request: LoginRequest, response: Response, db = Depends(get_sess
         httponly=True,
         secure=False,  # Set to True in production with HTTPS
         samesite="lax",
-        max_age=ACCESS_TOKEN_EXPIRE_HOURS * 3600  # Convert hours to seconds
+        max_age=ACCESS_TOKEN_EXPIRE_SECONDS
     )
     
     logger.info(f"Successful login for user: {request.username}")
-    return LoginResponse(
+    return LoginResponse.model_construct(
         token=access_token,
         user_id=user.id,
-        expires=expires.isoformat() + "Z"
+        expires=utc_isoformat_cached(expires_at)
     )
 
 @app.post("/api/logout")
-async def logout(response: Response, username: str = Depends(verify_token)):
-    # Clear the auth cookie
+async def logout(
+    response: Response,
+    username: str = Depends(verify_token),
+    token: Optional[str] = Depends(get_request_token)
+):
+    # Clearing the cookie signs the browser out. Dropping the token from this
+    # worker is best-effort only; other workers accept it until it expires.
+    forget_logged_out_token(token)
     response.delete_cookie(key="auth_token", samesite="lax")
     return {"message": "Logged out successfully"}
 
-@app.get("/api/user/me", response_model=UserResponse)
-async def get_current_user(username: str = Depends(verify_token), db = Depends(get_session)):
+@app.get("/api/user/me", response_model=None, responses={200: {"model": UserResponse}})
+async def get_current_user(user: CurrentUser = Depends(get_current_user_obj)):
     
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    return UserResponse(
+    return UserResponse.model_construct(
         id=user.id,
         username=user.username,
         email=user.email,
@@ -423,10 +664,10 @@ async def get_current_user(username: str = Depends(verify_token), db = Depends(g
     )
 
 @app.put("/api/user/settings")
-async def update_user_settings(
+def update_user_settings(
     settings_data: dict,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Update user settings."""
     user = crud.user.get_by_username(db, username=username)
@@ -440,21 +681,19 @@ async def update_user_settings(
     
     if update_data:
         updated_user = crud.user.update(db, db_obj=user, obj_in=update_data)
+        invalidate_cached_user(username)
         return {"message": "User settings updated successfully"}
     else:
         return {"message": "No settings to update"}
 
-@app.post("/api/register", response_model=RegisterResponse)
-async def register(request: RegisterRequest, db = Depends(get_session)):
+@app.post("/api/register", response_model=None, responses={200: {"model": RegisterResponse}})
+def register(request: RegisterRequest, db = Depends(get_session_async)):
     
-    # Check if username already exists
-    existing_user = crud.user.get_by_username(db, username=request.username)
-    if existing_user:
+    # Reject obvious duplicates before paying for the bcrypt hash
+    conflicts = crud.user.find_conflicts(db, username=request.username, email=request.email)
+    if "username" in conflicts:
         raise HTTPException(status_code=400, detail="Username already exists")
-    
-    # Check if email already exists
-    existing_email = crud.user.get_by_email(db, email=request.email)
-    if existing_email:
+    if "email" in conflicts:
         raise HTTPException(status_code=400, detail="Email already exists")
     
     # Create new user
@@ -465,18 +704,60 @@ async def register(request: RegisterRequest, db = Depends(get_session)):
         "is_admin": False
     }
     
-    new_user = crud.user.create(db, obj_in=user_data)
+    # The UNIQUE constraints still catch a concurrent registration that slips
+    # in between the check above and the insert
+    try:
+        new_user = crud.user.create(db, obj_in=user_data)
+    except IntegrityError as e:
+        db.rollback()
+        if "username" in str(e.orig):
+            raise HTTPException(status_code=400, detail="Username already exists")
+        raise HTTPException(status_code=400, detail="Email already exists")
     
-    return RegisterResponse(
+    return RegisterResponse.model_construct(
         user_id=new_user.id,
         message="Registration successful"
     )
 
-@app.get("/api/today", response_model=TodayResponse)
-async def get_today(
+TODAY_STATS_QUERY = text("""
+    WITH day_articles AS (
+        SELECT id, category FROM rss_items_metadata
+        WHERE created_at >= :date_start AND created_at <= :date_end
+    ),
+    top_topics AS (
+        SELECT t.name, count(at.topic_id) AS article_count
+        FROM topics t
+        JOIN article_topics at ON at.topic_id = t.id
+        JOIN day_articles a ON a.id = at.rss_item_id
+        WHERE t.is_active = TRUE
+        GROUP BY t.name
+        ORDER BY article_count DESC
+        LIMIT 3
+    ),
+    trending AS (
+        SELECT category, count(*) AS article_count
+        FROM day_articles
+        WHERE category IS NOT NULL
+        GROUP BY category
+        ORDER BY article_count DESC
+        LIMIT 3
+    )
+    SELECT
+        (SELECT count(*) FROM day_articles) AS total_articles,
+        (SELECT count(*) FROM events
+         WHERE created_at >= :date_start AND created_at <= :date_end) AS clusters_count,
+        (SELECT array_agg(name ORDER BY article_count DESC) FROM top_topics) AS top_topics,
+        (SELECT array_agg(category ORDER BY article_count DESC) FROM trending) AS trending_keywords,
+        (SELECT summary FROM user_summaries
+         WHERE user_id = :user_id AND date = :target_date) AS user_summary
+""")
+
+@app.get("/api/today", response_model=None, responses={200: {"model": TodayResponse}}, response_class=ORJSONResponse)
+def get_today(
+    request: Request,
     date_param: Optional[str] = None,
-    username: str = Depends(verify_token), 
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj), 
+    db = Depends(get_session_async)
 ):
     
     # Get the target date - use provided date or default to today
@@ -488,77 +769,42 @@ async def get_today(
     else:
         target_date = date.today()
     
-    # Calculate statistics from database
-    from sqlalchemy import func, and_
-    
     # Get total articles for the target date
     date_start = datetime.combine(target_date, datetime.min.time())
     date_end = datetime.combine(target_date, datetime.max.time())
     
-    total_articles = db.query(func.count(RSSItemMetadata.id)).filter(
-        and_(
-            RSSItemMetadata.created_at >= date_start,
-            RSSItemMetadata.created_at <= date_end
-        )
-    ).scalar() or 0
-    
-    # Get clusters count (events count as proxy for clusters)
-    clusters_count = db.query(func.count(Event.id)).filter(
-        and_(
-            Event.created_at >= date_start,
-            Event.created_at <= date_end
-        )
-    ).scalar() or 0
-    
-    # Get top topics (most active topics)
-    top_topics_query = db.query(Topic.name).join(ArticleTopic).join(RSSItemMetadata).filter(
-        and_(
-            RSSItemMetadata.created_at >= date_start,
-            RSSItemMetadata.created_at <= date_end,
-            Topic.is_active == True
-        )
-    ).group_by(Topic.name).order_by(func.count(ArticleTopic.topic_id).desc()).limit(3)
-    
-    top_topics = [row[0] for row in top_topics_query.all()]
-    if not top_topics:
-        top_topics = []
+    # All four daily statistics share one date range, so fetch them together with
+    # the user's summary in a single round-trip. Events count is the proxy for
+    # clusters; top categories are the proxy for trending keywords.
+    stats = db.execute(TODAY_STATS_QUERY, {
+        "date_start": date_start,
+        "date_end": date_end,
+        "user_id": user.id,
+        "target_date": target_date
+    }).one()
+    total_articles = stats.total_articles or 0
+    clusters_count = stats.clusters_count or 0
+    top_topics = list(stats.top_topics or [])
+    trending_keywords = [keyword for keyword in (stats.trending_keywords or []) if keyword]
     
     # Get user summary for the target date if exists
-    user = crud.user.get_by_username(db, username=username)
-    summary = f"No summary generated yet for {target_date.isoformat()}."
-    if user:
-        user_summary = crud.user_summary.get_by_date(db, user_id=user.id, date=target_date)
-        if user_summary and user_summary.summary:
-            summary = user_summary.summary
-    
-    # For trending keywords, get most common categories as a proxy
-    trending_keywords_query = db.query(RSSItemMetadata.category).filter(
-        and_(
-            RSSItemMetadata.created_at >= date_start,
-            RSSItemMetadata.created_at <= date_end,
-            RSSItemMetadata.category.isnot(None)
-        )
-    ).group_by(RSSItemMetadata.category).order_by(func.count().desc()).limit(3)
-    
-    trending_keywords = [row[0] for row in trending_keywords_query.all() if row[0]]
-    if not trending_keywords:
-        trending_keywords = []
+    summary = stats.user_summary or f"No summary generated yet for {target_date.isoformat()}."
     
-    return TodayResponse(
+    return etag_json_response(request, TodayResponse.model_construct(
         date=target_date.isoformat(),
         total_articles=total_articles,
         clusters_count=clusters_count,
         top_topics=top_topics,
         summary=summary,
         trending_keywords=trending_keywords
-    )
+    ))
 
-@app.get("/api/available-dates", response_model=AvailableDatesResponse)
-async def get_available_dates(
+@app.get("/api/available-dates", response_model=None, responses={200: {"model": AvailableDatesResponse}})
+def get_available_dates(
     year: int,
     month: int,
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Get all dates in a given month that have daily summaries available"""
     
@@ -568,20 +814,12 @@ async def get_available_dates(
     if year < 2000 or year > 3000:
         raise HTTPException(status_code=400, detail="Year must be reasonable")
     
-    # Get user
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Calculate start and end dates for the month
-    from calendar import monthrange
     start_date = date(year, month, 1)
     _, last_day = monthrange(year, month)
     end_date = date(year, month, last_day)
     
     # Query for all dates where this user has summaries
-    from newsfrontier_lib.models import UserSummary
-    from sqlalchemy import and_
     summaries = db.query(UserSummary.date).filter(
         and_(
             UserSummary.user_id == user.id,
@@ -590,29 +828,32 @@ async def get_available_dates(
             UserSummary.summary.isnot(None),
             UserSummary.summary != ""
         )
-    ).order_by(UserSummary.date).all()
+    ).order_by(UserSummary.date).execution_options(stream_results=True, yield_per=256)
     
-    # Format dates as strings
-    available_dates = [summary_date[0].isoformat() for summary_date in summaries]
+    # Format dates as strings while rows stream in, without materializing the result list
+    available_dates = [summary_date.isoformat() for (summary_date,) in summaries]
     
-    return AvailableDatesResponse(
+    return AvailableDatesResponse.model_construct(
         month=f"{year:04d}-{month:02d}",
         available_dates=available_dates
     )
 
+# Cover URLs are presigned for 2 hours; serve them for 90% of that so a
+# cached URL never reaches the client already expired
+COVER_URL_EXPIRES_IN = 7200
+_cover_url_cache = TTLCache(maxsize=10000, ttl=int(COVER_URL_EXPIRES_IN * 0.9))
+# (user_id, date) -> cover s3 key; short-lived so a freshly generated cover shows up quickly
+_cover_key_cache = TTLCache(maxsize=10000, ttl=60)
+_cover_cache_lock = threading.Lock()
+
 @app.get("/api/cover-image")
-async def get_cover_image(
+def get_cover_image(
     date_param: Optional[str] = None,
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Get cover image URL for today or specified date"""
     
-    # Get user
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Parse date parameter
     try:
         if date_param:
@@ -622,72 +863,101 @@ async def get_cover_image(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     
-    # Get user summary for the date
-    from newsfrontier_lib.models import UserSummary
-    summary = db.query(UserSummary).filter(
-        UserSummary.user_id == user.id,
-        UserSummary.date == target_date
-    ).first()
+    with _cover_cache_lock:
+        cover_s3key = _cover_key_cache.get((user.id, target_date))
     
-    if not summary:
-        raise HTTPException(status_code=404, detail="No summary found for the specified date")
-    
-    if not summary.cover_s3key:
-        raise HTTPException(status_code=404, detail="No cover image available for the specified date")
+    if cover_s3key is None:
+        # Get user summary for the date
+        summary = db.query(UserSummary.cover_s3key).filter(
+            UserSummary.user_id == user.id,
+            UserSummary.date == target_date
+        ).first()
+        
+        if not summary:
+            raise HTTPException(status_code=404, detail="No summary found for the specified date")
+        
+        cover_s3key = summary.cover_s3key
+        if not cover_s3key:
+            raise HTTPException(status_code=404, detail="No cover image available for the specified date")
+        
+        with _cover_cache_lock:
+            _cover_key_cache[(user.id, target_date)] = cover_s3key
     
     # Generate presigned URL for the cover image
     try:
-        from newsfrontier_lib.s3_client import get_cover_image_url
-        cover_url = get_cover_image_url(summary.cover_s3key)
+        with _cover_cache_lock:
+            cover_url = _cover_url_cache.get(cover_s3key)
         
-        if not cover_url:
-            raise HTTPException(status_code=500, detail="Failed to generate cover image URL")
+        if cover_url is None:
+            from newsfrontier_lib.s3_client import s3_client
+            cover_url = s3_client.get_image_url(cover_s3key, expires_in=COVER_URL_EXPIRES_IN)
+            
+            if not cover_url:
+                raise HTTPException(status_code=500, detail="Failed to generate cover image URL")
+            
+            with _cover_cache_lock:
+                _cover_url_cache[cover_s3key] = cover_url
         
         return {
             "date": target_date.isoformat(),
             "cover_url": cover_url,
-            "s3_key": summary.cover_s3key
+            "s3_key": cover_s3key
         }
         
     except Exception as e:
         logger.error(f"Error generating cover image URL: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate cover image URL")
 
-@app.get("/api/topics", response_model=TopicsResponse)
-async def get_topics(username: str = Depends(verify_token), db = Depends(get_session)):
-    
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+@app.get("/api/topics", response_model=None, responses={200: {"model": TopicsResponse}}, response_class=ORJSONResponse)
+def get_topics(request: Request, user: CurrentUser = Depends(get_current_user_obj), db = Depends(get_session_async)):
     
     # Get user's topics from database
     db_topics = crud.topic.get_user_topics(db, user_id=user.id)
     
-    # Convert to response format (note: no keywords field in database, using empty list)
+    # Convert to response format (note: no keywords field in database, using empty list).
+    # Plain dicts go straight to orjson; no per-topic model instance or model_dump walk
     topics = [
-        TopicDto(
-            id=topic.id, 
-            name=topic.name, 
-            keywords=[], 
-            active=topic.is_active
-        )
+        {
+            "id": topic.id,
+            "name": topic.name,
+            "keywords": [],
+            "active": topic.is_active
+        }
         for topic in db_topics
     ]
     
-    return TopicsResponse(topics=topics)
+    return etag_json_response(request, {"topics": topics})
 
-@app.post("/api/topics", response_model=TopicCreateResponse)
-async def create_topic(request: TopicRequest, username: str = Depends(verify_token), db = Depends(get_session)):
-    
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+async def trigger_topic_processing(topic_id: int, topic_name: str, topic_embedding: List[float], user_id: int):
+    """Ask the postprocess service to analyze existing articles for a new topic."""
+    try:
+        process_data = {
+            "topic_id": topic_id,
+            "topic_name": topic_name,
+            "topic_embedding": topic_embedding,
+            "user_id": user_id
+        }
+        
+        response = await postprocess_breaker.call(postprocess_client.post, "/api/process-new-topic", json=process_data)
+        
+        if response.status_code == 200:
+            logger.info(f"Successfully triggered article processing for topic '{topic_name}' (ID: {topic_id})")
+        else:
+            logger.warning(f"Failed to trigger article processing for topic '{topic_name}': HTTP {response.status_code}")
+            
+    except Exception as e:
+        logger.error(f"Error triggering article processing for topic '{topic_name}': {e}")
+
+@app.post("/api/topics", response_model=None, responses={200: {"model": TopicCreateResponse}})
+def create_topic(
+    request: TopicRequest,
+    background_tasks: BackgroundTasks,
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
+):
     
     # Check if topic with same name already exists for this user
-    existing_topic = crud.topic.get_by_name(db, user_id=user.id, name=request.name)
-    if existing_topic:
+    if crud.topic.name_exists(db, user_id=user.id, name=request.name):
         raise HTTPException(status_code=400, detail="Topic with this name already exists")
     
     # Generate embedding for the topic
@@ -708,56 +978,22 @@ async def create_topic(request: TopicRequest, username: str = Depends(verify_tok
     }
     
     new_topic = crud.topic.create(db, obj_in=topic_data)
+    invalidate_topic_matrix(user.id)
     
-    # Trigger article processing for the new topic if embedding was generated
+    # Trigger article processing for the new topic if embedding was generated;
+    # runs after the response is sent so the client doesn't wait on postprocess
     if topic_embedding:
-        try:
-            # Make async call to postprocess service to analyze existing articles
-            import threading
-            
-            def trigger_topic_processing():
-                try:
-                    postprocess_url = os.getenv("POSTPROCESS_URL", "http://localhost:8001")
-                    process_data = {
-                        "topic_id": new_topic.id,
-                        "topic_name": new_topic.name,
-                        "topic_embedding": topic_embedding,
-                        "user_id": user.id
-                    }
-                    
-                    response = requests.post(
-                        f"{postprocess_url}/api/process-new-topic", 
-                        json=process_data,
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        logger.info(f"Successfully triggered article processing for topic '{new_topic.name}' (ID: {new_topic.id})")
-                    else:
-                        logger.warning(f"Failed to trigger article processing for topic '{new_topic.name}': HTTP {response.status_code}")
-                        
-                except Exception as e:
-                    logger.error(f"Error triggering article processing for topic '{new_topic.name}': {e}")
-            
-            # Start background thread to avoid blocking the response
-            processing_thread = threading.Thread(target=trigger_topic_processing, daemon=True)
-            processing_thread.start()
-            
-        except Exception as e:
-            logger.error(f"Error setting up background processing for topic '{new_topic.name}': {e}")
+        background_tasks.add_task(
+            trigger_topic_processing, new_topic.id, new_topic.name, topic_embedding, user.id
+        )
     
-    return TopicCreateResponse(
+    return TopicCreateResponse.model_construct(
         id=new_topic.id,
         message=f"Topic created successfully{' with embedding' if topic_embedding else ''}. Processing existing articles in background."
     )
 
-@app.put("/api/topics/{topic_id}", response_model=TopicCreateResponse)
-async def update_topic(topic_id: int, request: TopicRequest, username: str = Depends(verify_token), db = Depends(get_session)):
-    
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+@app.put("/api/topics/{topic_id}", response_model=None, responses={200: {"model": TopicCreateResponse}})
+def update_topic(topic_id: int, request: TopicRequest, user: CurrentUser = Depends(get_current_user_obj), db = Depends(get_session_async)):
     
     # Get existing topic
     existing_topic = crud.topic.get(db, topic_id)
@@ -766,8 +1002,7 @@ async def update_topic(topic_id: int, request: TopicRequest, username: str = Dep
     
     # Check if name is being changed to one that already exists
     if request.name != existing_topic.name:
-        name_conflict = crud.topic.get_by_name(db, user_id=user.id, name=request.name)
-        if name_conflict:
+        if crud.topic.name_exists(db, user_id=user.id, name=request.name):
             raise HTTPException(status_code=400, detail="Topic with this name already exists")
     
     # Generate new embedding if topic name changed
@@ -788,14 +1023,15 @@ async def update_topic(topic_id: int, request: TopicRequest, username: str = Dep
     }
     
     updated_topic = crud.topic.update(db, db_obj=existing_topic, obj_in=update_data)
+    invalidate_topic_matrix(user.id)
     
-    return TopicCreateResponse(
+    return TopicCreateResponse.model_construct(
         id=updated_topic.id,
         message=f"Topic updated successfully{' with new embedding' if request.name != existing_topic.name and topic_embedding else ''}"
     )
 
 @app.delete("/api/topics/{topic_id}")
-async def delete_topic(topic_id: int, username: str = Depends(verify_token), db = Depends(get_session)):
+def delete_topic(topic_id: int, user: CurrentUser = Depends(get_current_user_obj), db = Depends(get_session_async)):
     """
     Delete a topic and all its associated data.
     
@@ -807,30 +1043,22 @@ async def delete_topic(topic_id: int, username: str = Depends(verify_token), db
     Due to the cascade delete relationships defined in the database models.
     """
     
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Get existing topic
-    existing_topic = crud.topic.get(db, topic_id)
-    if not existing_topic:
+    # Get existing topic together with related-row counts for logging
+    topic_with_counts = crud.topic.get_with_counts(db, topic_id)
+    if not topic_with_counts:
         raise HTTPException(status_code=404, detail="Topic not found")
+    existing_topic, events_count, article_topics_count, user_topics_count = topic_with_counts
     
     # Verify ownership - users can only delete their own topics
     if existing_topic.user_id != user.id:
         raise HTTPException(status_code=403, detail="You can only delete your own topics")
     
     try:
-        # Count related data for logging
-        events_count = len(existing_topic.events) if existing_topic.events else 0
-        article_topics_count = len(existing_topic.article_topics) if existing_topic.article_topics else 0
-        user_topics_count = len(existing_topic.user_topics) if existing_topic.user_topics else 0
-        
         topic_name = existing_topic.name
         
         # Delete the topic (cascade deletes will handle related data automatically)
         success = crud.topic.remove(db, id=topic_id)
+        invalidate_topic_matrix(user.id)
         
         if success:
             logger.info(f"Successfully deleted topic '{topic_name}' (ID: {topic_id}) for user {user.username}")
@@ -853,13 +1081,8 @@ async def delete_topic(topic_id: int, username: str = Depends(verify_token), db
         logger.error(f"Error deleting topic {topic_id} for user {user.username}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to delete topic: {str(e)}")
 
-@app.get("/api/topic/{topic_id}", response_model=TopicDetailResponse)
-async def get_topic_detail(topic_id: int, username: str = Depends(verify_token), db = Depends(get_session)):
-    
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+@app.get("/api/topic/{topic_id}", response_model=None, responses={200: {"model": TopicDetailResponse}})
+def get_topic_detail(topic_id: int, request: Request, user: CurrentUser = Depends(get_current_user_obj), db = Depends(get_session_async)):
     
     # Get topic from database
     db_topic = crud.topic.get(db, topic_id)
@@ -867,86 +1090,96 @@ async def get_topic_detail(topic_id: int, username: str = Depends(verify_token),
         raise HTTPException(status_code=404, detail="Topic not found")
     
     # Convert topic to response format
-    topic = TopicDto(
+    topic = TopicDto.model_construct(
         id=db_topic.id,
         name=db_topic.name,
         keywords=[],  # No keywords field in database
         active=db_topic.is_active
     )
     
-    # Get events (clusters) for this topic
-    events = crud.event.get_topic_events(db, topic_id=topic_id, limit=50)
+    # Get events (clusters) for this topic; article counts come from the same
+    # query instead of lazy-loading every event's article_events
+    events = crud.event.get_topic_events_with_article_counts(db, topic_id=topic_id, limit=50)
     clusters = [
-        Cluster(
+        Cluster.model_construct(
             id=event.id,
             title=event.title,
-            article_count=len(event.article_events),  # Count of articles in this event
+            article_count=article_count,  # Count of articles in this event
             summary=event.description or "No summary available"
         )
-        for event in events
+        for event, article_count in events
     ]
     
-    return TopicDetailResponse(
+    return etag_json_response(request, TopicDetailResponse.model_construct(
         topic=topic,
         clusters=clusters
-    )
+    ))
 
-@app.get("/api/cluster/{cluster_id}", response_model=ClusterDetailResponse)
-async def get_cluster_detail(cluster_id: int, username: str = Depends(verify_token), db = Depends(get_session)):
-    
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Get event (cluster) from database
-    event = crud.event.get(db, cluster_id)
-    if not event or event.user_id != user.id:
-        raise HTTPException(status_code=404, detail="Cluster not found")
+@app.get("/api/cluster/{cluster_id}", response_model=None, responses={200: {"model": ClusterDetailResponse}})
+def get_cluster_detail(cluster_id: int, request: Request, user: CurrentUser = Depends(get_current_user_obj), db = Depends(get_session_async)):
     
-    # Get articles associated with this event
-    from sqlalchemy.orm import joinedload
-    event_with_articles = db.query(Event).options(
+    # Get event (cluster) and its articles from database in one query
+    event = db.query(Event).options(
         joinedload(Event.article_events).joinedload(ArticleEvent.rss_item)
-    ).filter(Event.id == cluster_id).first()
-    
-    articles = []
-    if event_with_articles and event_with_articles.article_events:
-        articles = [
-            Article(
-                id=ae.rss_item.id,
-                title=ae.rss_item.title,
-                content=ae.rss_item.content,
-                url=ae.rss_item.url,
-                published_at=ae.rss_item.published_at.isoformat() + "Z" if ae.rss_item.published_at else None,
-                author=ae.rss_item.author,
-                category=ae.rss_item.category,
-                processing_status=ae.rss_item.processing_status,
-                created_at=ae.rss_item.created_at.isoformat() + "Z"
-            )
-            for ae in event_with_articles.article_events
-            if ae.rss_item
-        ]
+    ).filter(Event.id == cluster_id, Event.user_id == user.id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Cluster not found")
     
-    cluster = ClusterDetail(
-        id=event.id,
-        title=event.title,
-        summary=event.description or "No summary available",
-        articles=articles
-    )
+    # Plain dicts in the Article shape; datetimes are left for orjson to format
+    articles = [
+        {
+            "id": ae.rss_item.id,
+            "title": ae.rss_item.title,
+            "content": ae.rss_item.content,
+            "url": ae.rss_item.url,
+            "published_at": ae.rss_item.published_at,
+            "author": ae.rss_item.author,
+            "category": ae.rss_item.category,
+            "processing_status": ae.rss_item.processing_status,
+            "created_at": ae.rss_item.created_at,
+            "derivative": None
+        }
+        for ae in event.article_events
+        if ae.rss_item
+    ]
     
-    return ClusterDetailResponse(cluster=cluster)
+    return etag_json_response(request, {
+        "cluster": {
+            "id": event.id,
+            "title": event.title,
+            "summary": event.description or "No summary available",
+            "articles": articles
+        }
+    })
+
+def encode_article_cursor(article) -> str:
+    """Opaque cursor pointing just past the given article in created_at/id order."""
+    raw = f"{article.created_at.isoformat()}|{article.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
-@app.get("/api/articles", response_model=ArticlesResponse)
-async def get_articles(
+def decode_article_cursor(cursor: str):
+    """Inverse of encode_article_cursor; raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, article_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(article_id)
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+@app.get("/api/articles", response_model=None, responses={200: {"model": ArticlesResponse}})
+def get_articles(
     page: int = 1,
     limit: int = 20,
     status: str = "completed",  # Default to completed articles only
+    cursor: Optional[str] = None,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """
-    Get completed articles with pagination support
+    Get completed articles with pagination support.
+    
+    Pass the returned next_cursor back as `cursor` to page by seeking on
+    (created_at, id) instead of OFFSET; deep pages then cost the same as the first.
     """
     
     # Input validation
@@ -959,61 +1192,91 @@ async def get_articles(
     skip = (page - 1) * limit
     
     # Get articles from database
-    from sqlalchemy import func
-    total_query = db.query(func.count(RSSItemMetadata.id)).filter(
-        RSSItemMetadata.processing_status == status
-    )
-    total = total_query.scalar()
-    
     articles_query = db.query(RSSItemMetadata).filter(
         RSSItemMetadata.processing_status == status
-    ).order_by(RSSItemMetadata.created_at.desc()).offset(skip).limit(limit)
+    )
     
-    db_articles = articles_query.all()
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_article_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        articles_query = articles_query.filter(
+            tuple_(RSSItemMetadata.created_at, RSSItemMetadata.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    else:
+        # The window count is evaluated before OFFSET/LIMIT, so every row carries
+        # the full total and the page needs no separate COUNT(*) round-trip.
+        # Cursor clients only need has_next, so they skip the count entirely.
+        articles_query = articles_query.add_columns(
+            func.count().over().label("total")
+        ).offset(skip)
+    
+    # Fetch one extra row to learn whether another page exists
+    rows = articles_query.order_by(
+        RSSItemMetadata.created_at.desc(), RSSItemMetadata.id.desc()
+    ).limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    
+    if cursor:
+        total = None
+        db_articles = rows
+    else:
+        db_articles = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        else:
+            # A page past the end returns no rows to read the total from
+            total = db.query(func.count(RSSItemMetadata.id)).filter(
+                RSSItemMetadata.processing_status == status
+            ).scalar()
     
-    # Convert to Pydantic models
+    # Build the ArticlesResponse shape as plain dicts; returning the response
+    # directly skips FastAPI's jsonable_encoder pass over every article
     articles = [
-        Article(
-            id=article.id,
-            title=article.title,
-            content=article.content,
-            url=article.url,
-            published_at=article.published_at.isoformat() + "Z" if article.published_at else None,
-            author=article.author,
-            category=article.category,
-            processing_status=article.processing_status,
-            created_at=article.created_at.isoformat() + "Z"
-        )
+        {
+            "id": article.id,
+            "title": article.title,
+            "content": article.content,
+            "url": article.url,
+            "published_at": article.published_at,
+            "author": article.author,
+            "category": article.category,
+            "processing_status": article.processing_status,
+            "created_at": article.created_at
+        }
         for article in db_articles
     ]
     
     # Create pagination info
-    has_next = skip + limit < total
-    has_prev = page > 1
-    
-    pagination = PaginationInfo(
-        page=page,
-        limit=limit,
-        total=total,
-        has_next=has_next,
-        has_prev=has_prev
-    )
-    
-    return ArticlesResponse(
-        data=articles,
-        pagination=pagination
-    )
+    has_prev = bool(cursor) or page > 1
+    
+    return UTCORJSONResponse({
+        "data": articles,
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "has_next": has_next,
+            "has_prev": has_prev,
+            "next_cursor": encode_article_cursor(db_articles[-1]) if has_next else None
+        }
+    })
 
-@app.get("/api/article/{article_id}")
-async def get_article_detail(
+@app.get("/api/article/{article_id}", response_model=None, responses={200: {"model": Article}})
+def get_article_detail(
     article_id: int, 
+    request: Request,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """
     Get detailed information about a specific article including AI-generated summary
     """
-    from sqlalchemy.orm import joinedload
+    cached = get_cached_article_response("detail", article_id)
+    if cached:
+        return etag_body_response(request, *cached)
     
     # Get article with its derivatives from database
     article = db.query(RSSItemMetadata).options(
@@ -1026,31 +1289,34 @@ async def get_article_detail(
     # Create derivative data if available
     derivative_data = None
     if article.derivatives:
-        derivative_data = ArticleDerivative(
-            summary=article.derivatives.summary,
-            summary_generated_at=article.derivatives.summary_generated_at.isoformat() + "Z" if article.derivatives.summary_generated_at else None,
-            llm_model_version=article.derivatives.llm_model_version,
-            processing_status=article.derivatives.processing_status
-        )
+        derivative_data = {
+            "summary": article.derivatives.summary,
+            "summary_generated_at": article.derivatives.summary_generated_at,
+            "llm_model_version": article.derivatives.llm_model_version,
+            "processing_status": article.derivatives.processing_status
+        }
     
-    return Article(
-        id=article.id,
-        title=article.title,
-        content=article.content,
-        url=article.url,
-        published_at=article.published_at.isoformat() + "Z" if article.published_at else None,
-        author=article.author,
-        category=article.category,
-        processing_status=article.processing_status,
-        created_at=article.created_at.isoformat() + "Z",
-        derivative=derivative_data
-    )
+    payload = {
+        "id": article.id,
+        "title": article.title,
+        "content": article.content,
+        "url": article.url,
+        "published_at": article.published_at,
+        "author": article.author,
+        "category": article.category,
+        "processing_status": article.processing_status,
+        "created_at": article.created_at,
+        "derivative": derivative_data
+    }
+    if article.processing_status == "completed":
+        return etag_body_response(request, *cache_article_response("detail", article_id, payload))
+    return etag_body_response(request, *encode_json_with_etag(payload))
 
 @app.post("/api/article/{article_id}/reprocess-anchors")
-async def reprocess_article_anchors(
+def reprocess_article_anchors(
     article_id: int,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """
     Reprocess an existing article to add sentence anchors
@@ -1064,17 +1330,18 @@ async def reprocess_article_anchors(
     if not article.content:
         raise HTTPException(status_code=400, detail="Article has no content to process")
     
-    # Process content with anchors
+    # Process content with anchors. This handler is a plain def, so the CPU work
+    # runs on the threadpool rather than the event loop.
     try:
         processed_content = process_text_with_anchors(article.content)
         
         # Update article with processed content
         article.content = processed_content
         db.commit()
-        db.refresh(article)
+        invalidate_article_responses(article_id)
         
-        # Extract sentence information for response
-        sentence_info = extract_paragraphs_with_anchors(article.content)
+        # Extract sentence information for response from the content just written
+        sentence_info = extract_paragraphs_with_anchors(processed_content)
         
         return {
             "message": "Article content reprocessed with sentence anchors",
@@ -1088,40 +1355,51 @@ async def reprocess_article_anchors(
         raise HTTPException(status_code=500, detail=f"Failed to reprocess article: {str(e)}")
 
 @app.get("/api/article/{article_id}/sentences")
-async def get_article_sentences(
+def get_article_sentences(
     article_id: int,
+    request: Request,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """
     Get sentence breakdown of an article with anchor information
     """
+    cached = get_cached_article_response("sentences", article_id)
+    if cached:
+        return etag_body_response(request, *cached)
+    
     # Get article from database
     article = crud.rss_item.get(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
     if not article.content:
-        return {"sentences": [], "total_sentences": 0}
-    
-    # Extract sentence information
-    sentence_info = extract_paragraphs_with_anchors(article.content)
+        payload = {"sentences": [], "total_sentences": 0}
+    else:
+        # Extract sentence information
+        sentence_info = extract_paragraphs_with_anchors(article.content)
+        payload = {
+            "article_id": article_id,
+            "sentences": sentence_info,
+            "total_sentences": len(sentence_info)
+        }
     
-    return {
-        "article_id": article_id,
-        "sentences": sentence_info,
-        "total_sentences": len(sentence_info)
-    }
+    return etag_body_response(request, *cache_article_response("sentences", article_id, payload))
 
 @app.get("/api/article/{article_id}/processing-info")
-async def get_article_processing_info(
+def get_article_processing_info(
     article_id: int,
+    request: Request,
     username: str = Depends(verify_token),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """
     Get information about how article content would be processed
     """
+    cached = get_cached_article_response("processing-info", article_id)
+    if cached:
+        return etag_body_response(request, *cached)
+    
     # Get article from database
     article = crud.rss_item.get(db, article_id)
     if not article:
@@ -1130,65 +1408,51 @@ async def get_article_processing_info(
     # Get processing information
     processing_info = get_text_processing_info(article.content)
     
-    return {
+    return etag_body_response(request, *cache_article_response("processing-info", article_id, {
         "article_id": article_id,
         "processing_info": processing_info,
         "has_content": bool(article.content),
         "content_preview": article.content[:200] if article.content else None
-    }
+    }))
 
 # RSS Feeds Management API Endpoints
 @app.get("/api/feeds")
-async def get_user_feeds(
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+def get_user_feeds(
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Get user's RSS feed subscriptions."""
-    logger.info(f"Getting RSS feeds for user: {username}")
+    logger.info(f"Getting RSS feeds for user: {user.username}")
     
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        logger.error(f"User not found in database: {username}")
-        raise HTTPException(status_code=404, detail="User not found")
+    # Get user's subscribed feeds in one joined query
+    feeds = crud.rss_subscription.get_user_subscribed_feeds(db, user_id=user.id)
     
-    # Get user's RSS subscriptions with feed details
-    subscriptions = crud.rss_subscription.get_user_subscriptions(db, user_id=user.id)
-    
-    result = []
-    for subscription in subscriptions:
-        # Get the RSS feed details
-        feed = crud.rss_feed.get_by_uuid(db, uuid=str(subscription.rss_uuid))
-        if feed:
-            result.append({
-                "id": feed.id,
-                "uuid": str(feed.uuid),
-                "url": feed.url,
-                "title": feed.title,
-                "description": feed.description,
-                "created_at": feed.created_at.isoformat(),
-                "updated_at": feed.updated_at.isoformat(),
-                "last_fetch_at": feed.last_fetch_at.isoformat() if feed.last_fetch_at else None,
-                "last_fetch_status": feed.last_fetch_status,
-                "fetch_interval_minutes": feed.fetch_interval_minutes
-            })
+    result = [
+        {
+            "id": feed.id,
+            "uuid": feed.uuid,
+            "url": feed.url,
+            "title": feed.title,
+            "description": feed.description,
+            "created_at": feed.created_at,
+            "updated_at": feed.updated_at,
+            "last_fetch_at": feed.last_fetch_at,
+            "last_fetch_status": feed.last_fetch_status,
+            "fetch_interval_minutes": feed.fetch_interval_minutes
+        }
+        for feed in feeds
+    ]
     
-    return result
+    return ORJSONResponse(result)
 
 @app.post("/api/feeds")
-async def create_rss_feed(
+def create_rss_feed(
     feed_data: dict,
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Add a new RSS feed subscription for the user."""
     
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        logger.error(f"User not found in database: {username}")
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Validate required fields
     url = feed_data.get("url")
     if not url:
@@ -1200,7 +1464,7 @@ async def create_rss_feed(
     if existing_feed:
         # Feed exists, create subscription if not already subscribed
         existing_subscription = crud.rss_subscription.get_user_subscription(
-            db, user_id=user.id, rss_uuid=str(existing_feed.uuid)
+            db, user_id=user.id, rss_uuid=existing_feed.uuid
         )
         
         if existing_subscription:
@@ -1261,23 +1525,17 @@ async def create_rss_feed(
         }
 
 @app.put("/api/feeds/{feed_uuid}")
-async def update_rss_feed(
+def update_rss_feed(
     feed_uuid: UUID,
     feed_data: dict,
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Update RSS feed subscription settings."""
     
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        logger.error(f"User not found in database: {username}")
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Check if user has subscription to this feed
     subscription = crud.rss_subscription.get_user_subscription(
-        db, user_id=user.id, rss_uuid=str(feed_uuid)
+        db, user_id=user.id, rss_uuid=feed_uuid
     )
     if not subscription:
         raise HTTPException(status_code=404, detail="RSS feed subscription not found")
@@ -1286,7 +1544,7 @@ async def update_rss_feed(
     updated_subscription = crud.rss_subscription.update_subscription(
         db,
         user_id=user.id,
-        rss_uuid=str(feed_uuid),
+        rss_uuid=feed_uuid,
         alias=feed_data.get("alias"),
         is_active=feed_data.get("is_active")
     )
@@ -1295,7 +1553,7 @@ async def update_rss_feed(
         raise HTTPException(status_code=404, detail="Failed to update subscription")
     
     # Get the feed details to return
-    feed = crud.rss_feed.get_by_uuid(db, uuid=str(feed_uuid))
+    feed = crud.rss_feed.get_by_uuid(db, uuid=feed_uuid)
     if not feed:
         raise HTTPException(status_code=404, detail="RSS feed not found")
     
@@ -1313,22 +1571,16 @@ async def update_rss_feed(
     }
 
 @app.delete("/api/feeds/{feed_uuid}")
-async def delete_rss_feed(
+def delete_rss_feed(
     feed_uuid: UUID,
-    username: str = Depends(verify_token),
-    db = Depends(get_session)
+    user: CurrentUser = Depends(get_current_user_obj),
+    db = Depends(get_session_async)
 ):
     """Remove RSS feed subscription."""
     
-    # Get user from database
-    user = crud.user.get_by_username(db, username=username)
-    if not user:
-        logger.error(f"User not found in database: {username}")
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Delete user's subscription to this feed
     success = crud.rss_subscription.delete_subscription(
-        db, user_id=user.id, rss_uuid=str(feed_uuid)
+        db, user_id=user.id, rss_uuid=feed_uuid
     )
     
     if not success:
@@ -1360,28 +1612,28 @@ async def trigger_feed_fetch(
 
 # Article Processing API for Scraper Integration
 @app.get("/api/internal/feeds/pending")
-async def get_feeds_pending_fetch(db = Depends(get_session)):
+def get_feeds_pending_fetch(db = Depends(get_session_async)):
     """Internal API for scraper: Get feeds that need fetching."""
     
     # Get feeds that are due for fetching
     feeds = crud.rss_feed.get_feeds_due_for_fetch(db)
-    return [
+    return ORJSONResponse([
         {
             "id": feed.id,
-            "uuid": str(feed.uuid),
+            "uuid": feed.uuid,
             "url": feed.url,
             "title": feed.title,
-            "last_fetch_at": feed.last_fetch_at.isoformat() if feed.last_fetch_at else None,
+            "last_fetch_at": feed.last_fetch_at,
             "fetch_interval_minutes": feed.fetch_interval_minutes
         }
         for feed in feeds
-    ]
+    ])
 
 @app.post("/api/internal/feeds/{feed_id}/status")
-async def update_feed_fetch_status(
+def update_feed_fetch_status(
     feed_id: int,
     status_data: dict,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API for scraper: Update feed fetch status."""
     
@@ -1391,7 +1643,8 @@ async def update_feed_fetch_status(
     
     if fetch_time_str:
         try:
-            fetch_time = datetime.fromisoformat(fetch_time_str.replace('Z', '+00:00'))
+            # Python 3.11's C fromisoformat accepts the trailing Z directly
+            fetch_time = datetime.fromisoformat(fetch_time_str)
         except ValueError:
             fetch_time = datetime.utcnow()
     else:
@@ -1407,9 +1660,9 @@ async def update_feed_fetch_status(
     return {"message": "Feed status updated successfully", "feed_id": feed.id}
 
 @app.post("/api/internal/fetch-records")
-async def create_or_update_fetch_record(
+def create_or_update_fetch_record(
     fetch_data: dict,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API for scraper: Create new or update existing RSS fetch record."""
     
@@ -1423,111 +1676,112 @@ async def create_or_update_fetch_record(
         rss_feed_id = fetch_data["rss_feed_id"]
         content_hash = fetch_data["content_hash"]
         
-        # Check if a record with the same feed_id and content_hash exists
-        existing_record = db.query(RSSFetchRecord).filter(
-            RSSFetchRecord.rss_feed_id == rss_feed_id,
-            RSSFetchRecord.content_hash == content_hash
-        ).first()
-        
-        if existing_record:
-            # Update last_fetch_timestamp for existing record
-            existing_record.last_fetch_timestamp = func.now()
-            existing_record.http_status = fetch_data.get("http_status", existing_record.http_status)
-            existing_record.content_encoding = fetch_data.get("content_encoding", existing_record.content_encoding)
-            
-            db.commit()
-            db.refresh(existing_record)
-            
-            return {
-                "id": existing_record.id,
-                "rss_feed_id": existing_record.rss_feed_id,
-                "content_hash": existing_record.content_hash,
-                "first_fetch_timestamp": existing_record.first_fetch_timestamp.isoformat(),
-                "last_fetch_timestamp": existing_record.last_fetch_timestamp.isoformat(),
-                "is_duplicate": True,
-                "message": "Existing fetch record updated with new fetch timestamp"
-            }
-        else:
-            # Create new fetch record
-            record_data = {
-                "rss_feed_id": rss_feed_id,
-                "raw_content": fetch_data["raw_content"],
-                "content_hash": content_hash,
-                "http_status": fetch_data.get("http_status"),
-                "content_encoding": fetch_data.get("content_encoding")
-            }
-            
-            fetch_record = RSSFetchRecord(**record_data)
-            db.add(fetch_record)
-            db.commit()
-            db.refresh(fetch_record)
-            
-            return {
-                "id": fetch_record.id,
-                "rss_feed_id": fetch_record.rss_feed_id,
-                "content_hash": fetch_record.content_hash,
-                "first_fetch_timestamp": fetch_record.first_fetch_timestamp.isoformat(),
-                "last_fetch_timestamp": fetch_record.last_fetch_timestamp.isoformat(),
-                "is_duplicate": False,
-                "message": "New fetch record created successfully"
+        # Insert, or bump the fetch timestamp when this feed already has the same
+        # content. One round-trip, and concurrent fetches can't both insert.
+        insert_stmt = pg_insert(RSSFetchRecord).values(
+            rss_feed_id=rss_feed_id,
+            raw_content=fetch_data["raw_content"],
+            content_hash=content_hash,
+            http_status=fetch_data.get("http_status"),
+            content_encoding=fetch_data.get("content_encoding")
+        )
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            # Matches the table constraint on fresh databases and the unique
+            # index that `db_manage.py migrate` adds to older ones
+            index_elements=[RSSFetchRecord.rss_feed_id, RSSFetchRecord.content_hash],
+            set_={
+                "last_fetch_timestamp": func.now(),
+                "http_status": func.coalesce(insert_stmt.excluded.http_status, RSSFetchRecord.http_status),
+                "content_encoding": func.coalesce(insert_stmt.excluded.content_encoding, RSSFetchRecord.content_encoding)
             }
+        ).returning(
+            RSSFetchRecord.id,
+            RSSFetchRecord.rss_feed_id,
+            RSSFetchRecord.content_hash,
+            RSSFetchRecord.first_fetch_timestamp,
+            RSSFetchRecord.last_fetch_timestamp,
+            # xmax is only set on the row when the conflict branch updated it
+            literal_column("xmax <> 0").label("is_duplicate")
+        )
+        fetch_record = db.execute(upsert_stmt).one()
+        db.commit()
+        
+        return {
+            "id": fetch_record.id,
+            "rss_feed_id": fetch_record.rss_feed_id,
+            "content_hash": fetch_record.content_hash,
+            "first_fetch_timestamp": fetch_record.first_fetch_timestamp.isoformat(),
+            "last_fetch_timestamp": fetch_record.last_fetch_timestamp.isoformat(),
+            "is_duplicate": fetch_record.is_duplicate,
+            "message": (
+                "Existing fetch record updated with new fetch timestamp" if fetch_record.is_duplicate
+                else "New fetch record created successfully"
+            )
+        }
         
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create/update fetch record: {str(e)}")
 
-@app.post("/api/internal/articles")
-async def create_articles(
-    articles_data: List[dict],
-    db = Depends(get_session)
-):
-    """Internal API for scraper: Create new articles from RSS feeds."""
+def store_scraped_articles(articles_data: List[dict], db) -> dict:
+    """Insert scraped articles, skipping duplicates by RSS feed UUID + GUID."""
+    
+    # Resolve every fetch record's feed and look up already-stored GUIDs for the
+    # whole batch up front: two queries instead of three per article
+    fetch_record_ids = {
+        article_data["rss_fetch_record_id"] for article_data in articles_data
+        if article_data.get("guid") and isinstance(article_data.get("rss_fetch_record_id"), int)
+    }
+    feed_uuids = crud.rss_fetch_record.get_feed_uuids(db, ids=list(fetch_record_ids))
+    candidate_pairs = {
+        (feed_uuids[article_data["rss_fetch_record_id"]], article_data["guid"])
+        for article_data in articles_data
+        if article_data.get("guid") and article_data.get("rss_fetch_record_id") in feed_uuids
+    }
+    existing_guids = crud.rss_item.get_existing_feed_guids(db, pairs=list(candidate_pairs))
     
     # Create articles from scraper data
-    created_count = 0
     failed_count = 0
+    to_insert = []
+    batch_keys = set()
     
     for article_data in articles_data:
         try:
             # Validate required fields
-            required_fields = ["rss_fetch_record_id", "title"]
-            for field in required_fields:
-                if field not in article_data:
-                    print(f"Missing required field {field} in article data")
-                    failed_count += 1
-                    continue
+            missing_fields = [field for field in ("rss_fetch_record_id", "title") if field not in article_data]
+            if missing_fields:
+                print(f"Missing required fields {missing_fields} in article data")
+                failed_count += 1
+                continue
             
             # Check if article already exists (by RSS feed UUID and GUID)
-            if article_data.get("guid"):
-                # Get RSS feed UUID from fetch_record_id
-                fetch_record = crud.rss_fetch_record.get(db, article_data["rss_fetch_record_id"])
-                if fetch_record:
-                    rss_feed = crud.rss_feed.get(db, fetch_record.rss_feed_id)
-                    if rss_feed:
-                        existing_item = crud.rss_item.get_by_rss_feed_uuid_and_guid(
-                            db, 
-                            rss_feed_uuid=str(rss_feed.uuid),
-                            guid=article_data["guid"]
-                        )
-                        if existing_item:
-                            continue  # Skip duplicates
+            guid = article_data.get("guid")
+            if guid:
+                feed_uuid = feed_uuids.get(article_data["rss_fetch_record_id"])
+                if feed_uuid is not None and (feed_uuid, guid) in existing_guids:
+                    continue  # Skip duplicates
+                
+                # The same item can appear twice in one batch; the second copy
+                # would trip the (rss_fetch_record_id, guid) constraint
+                batch_key = (feed_uuid or article_data["rss_fetch_record_id"], guid)
+                if batch_key in batch_keys:
+                    continue
+                batch_keys.add(batch_key)
             
             # Parse published_at if provided
             published_at = None
             if article_data.get("published_at"):
                 try:
-                    published_at = datetime.fromisoformat(
-                        article_data["published_at"].replace('Z', '+00:00')
-                    )
+                    published_at = datetime.fromisoformat(article_data["published_at"])
                 except ValueError:
                     pass
             
             # Process content with sentence anchors
             original_content = article_data.get("content")
-            processed_content = process_text_with_anchors(original_content) if original_content else None
+            processed_content = process_text_with_anchors_cached(original_content) if original_content else None
             
             # Create RSSItemMetadata
-            item_data = {
+            to_insert.append({
                 "rss_fetch_record_id": article_data["rss_fetch_record_id"],
                 "guid": article_data.get("guid"),
                 "title": article_data["title"],
@@ -1537,15 +1791,33 @@ async def create_articles(
                 "author": article_data.get("author"),
                 "category": article_data.get("category"),
                 "processing_status": "pending"
-            }
-            
-            crud.rss_item.create(db, obj_in=item_data)
-            created_count += 1
+            })
             
         except Exception as e:
             print(f"Failed to create article: {e}")
             failed_count += 1
     
+    # Insert the whole batch in one statement and one transaction
+    created_count = 0
+    if to_insert:
+        try:
+            db.bulk_insert_mappings(RSSItemMetadata, to_insert)
+            db.commit()
+            created_count = len(to_insert)
+        except Exception as e:
+            db.rollback()
+            print(f"Batch insert failed, retrying articles one by one: {e}")
+            # Fall back to per-row inserts so one bad row doesn't drop the batch
+            for item_data in to_insert:
+                try:
+                    db.bulk_insert_mappings(RSSItemMetadata, [item_data])
+                    db.commit()
+                    created_count += 1
+                except Exception as e:
+                    db.rollback()
+                    print(f"Failed to create article: {e}")
+                    failed_count += 1
+    
     return {
         "message": f"Created {created_count} articles successfully",
         "created": created_count,
@@ -1553,33 +1825,72 @@ async def create_articles(
         "total": len(articles_data)
     }
 
-@app.get("/api/internal/articles/pending-processing")
-async def get_articles_pending_processing(
-    limit: int = 50,
-    db = Depends(get_session)
+@app.post(
+    "/api/internal/articles",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "array", "items": {"type": "object"}}}}
+        }
+    }
+)
+async def create_articles(
+    request: Request,
+    db = Depends(get_session_async)
 ):
+    """Internal API for scraper: Create new articles from RSS feeds."""
+    
+    # Scraper batches can carry full article bodies; parse them with orjson in one
+    # pass instead of letting pydantic validate every dict in a List[dict]
+    try:
+        articles_data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(articles_data, list) or not all(isinstance(item, dict) for item in articles_data):
+        raise HTTPException(status_code=422, detail="Request body must be a list of article objects")
+    
+    # Per-article lookups and inserts are blocking SQLAlchemy calls
+    return await run_in_threadpool(store_scraped_articles, articles_data, db)
+
+def stream_pending_articles(limit: int):
+    """Yield the pending-processing list as JSON array chunks, one article at a time."""
+    # The request-scoped session is closed before a streaming body is sent, so
+    # the generator holds its own session for as long as the cursor is open
+    with get_default_session_maker()() as db:
+        rows = crud.rss_item.pending_processing_query(
+            db,
+            RSSItemMetadata.id, RSSItemMetadata.title, RSSItemMetadata.content, RSSItemMetadata.url,
+            RSSItemMetadata.published_at, RSSItemMetadata.processing_status, RSSItemMetadata.processing_attempts,
+            limit=limit
+        ).execution_options(stream_results=True, yield_per=100)
+        
+        separator = b"["
+        for row in rows:
+            yield separator + orjson.dumps({
+                "id": row.id,
+                "title": row.title,
+                "content": row.content,
+                "url": row.url,
+                "published_at": row.published_at,
+                "processing_status": row.processing_status,
+                "processing_attempts": row.processing_attempts
+            })
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+@app.get("/api/internal/articles/pending-processing")
+def get_articles_pending_processing(limit: int = 50):
     """Internal API for postprocess: Get articles that need AI processing."""
     
-    # Get pending articles from database
-    articles = crud.rss_item.get_pending_processing(db, limit=limit)
-    return [
-        {
-            "id": article.id,
-            "title": article.title,
-            "content": article.content,
-            "url": article.url,
-            "published_at": article.published_at.isoformat() if article.published_at else None,
-            "processing_status": article.processing_status,
-            "processing_attempts": article.processing_attempts
-        }
-        for article in articles
-    ]
+    # Stream rows from a server-side cursor instead of building the whole list;
+    # each item carries the full article body
+    return StreamingResponse(stream_pending_articles(limit), media_type="application/json")
 
 @app.post("/api/internal/articles/{article_id}/process")
-async def update_article_processing_status(
+def update_article_processing_status(
     article_id: int,
     status_data: ArticleProcessingUpdate,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API for postprocess: Update article processing status and store analysis data."""
     
@@ -1590,6 +1901,22 @@ async def update_article_processing_status(
     
     # Extract processing data from postprocess service
     title_embedding = status_data.title_embedding
+    if title_embedding is None and status_data.title_embedding_b64:
+        title_embedding = decode_embedding(status_data.title_embedding_b64)
+    has_title_embedding = title_embedding is not None and len(title_embedding) > 0
+    if has_title_embedding:
+        title_embedding = normalize_embedding(title_embedding)
+    summary_embedding = status_data.summary_embedding
+    if summary_embedding is None and status_data.summary_embedding_b64:
+        summary_embedding = decode_embedding(status_data.summary_embedding_b64)
+    if summary_embedding is not None and len(summary_embedding) > 0:
+        summary_embedding = normalize_embedding(summary_embedding)
+    elif has_title_embedding:
+        # Older postprocess builds only send the title embedding
+        summary_embedding = title_embedding
+    else:
+        summary_embedding = None
+    has_embedding = has_title_embedding or summary_embedding is not None
     embedding_model = status_data.embedding_model
     summary = status_data.summary
     summary_model = status_data.summary_model
@@ -1597,67 +1924,61 @@ async def update_article_processing_status(
     error_message = status_data.error_message
     
     # Determine processing status based on data provided
-    if title_embedding or summary:
+    if has_embedding or summary:
         status = "completed"
     elif error_message:
         status = "failed"
     else:
         status = status_data.get("status", "failed")
     
-    # Update article processing status
-    article = crud.rss_item.update_processing_status(
-        db, item_id=article_id, status=status, error_message=error_message
-    )
-    
-    # Store derivatives if provided
-    if title_embedding or summary:
-        from sqlalchemy.orm import Session
-        from newsfrontier_lib.models import RSSItemDerivative
-        
-        # Check if derivative already exists
-        existing_derivative = db.query(RSSItemDerivative).filter(
-            RSSItemDerivative.rss_item_id == article_id
-        ).first()
-        
-        derivative_data = {
-            "rss_item_id": article_id,
-            "summary": summary,
-            "title_embedding": title_embedding,
-            "summary_embedding": title_embedding,  # Use same embedding for both for now
-            "processing_status": "completed" if summary else "processing",
-            "summary_generated_at": datetime.utcnow() if summary else None,
-            "embeddings_generated_at": datetime.utcnow() if title_embedding else None,
-            "llm_model_version": summary_model,
-            "embedding_model_version": embedding_model
-        }
+    # Status change and derivative upsert go out in one transaction
+    try:
+        # Update article processing status
+        crud.rss_item.set_processing_status(article, status=status, error_message=error_message)
         
-        if existing_derivative:
-            # Update existing derivative
-            for field, value in derivative_data.items():
-                if field != "rss_item_id" and value is not None:
-                    setattr(existing_derivative, field, value)
-            db.commit()
-            db.refresh(existing_derivative)
-        else:
-            # Create new derivative
-            derivative = RSSItemDerivative(**derivative_data)
-            db.add(derivative)
-            db.commit()
-            db.refresh(derivative)
+        # Store derivatives if provided
+        if has_embedding or summary:
+            now = datetime.utcnow()
+            derivative_data = {
+                "rss_item_id": article_id,
+                "summary": summary,
+                "title_embedding": title_embedding if has_title_embedding else None,
+                "summary_embedding": summary_embedding,
+                "processing_status": "completed" if summary else "processing",
+                "summary_generated_at": now if summary else None,
+                "embeddings_generated_at": now if has_embedding else None,
+                "llm_model_version": summary_model,
+                "embedding_model_version": embedding_model
+            }
             
-            db.commit()
-            db.refresh(article)
+            # Insert, or update an existing derivative without a prior SELECT;
+            # fields that weren't provided keep their stored values
+            insert_stmt = pg_insert(RSSItemDerivative).values(**derivative_data)
+            db.execute(insert_stmt.on_conflict_do_update(
+                index_elements=[RSSItemDerivative.rss_item_id],
+                set_={
+                    field: func.coalesce(insert_stmt.excluded[field], getattr(RSSItemDerivative, field))
+                    for field in derivative_data if field != "rss_item_id"
+                }
+            ))
+        
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     
     response_data = {
         "message": "Article processing completed successfully",
-        "article_id": article.id,
+        "article_id": article_id,
         "status": status
     }
     
+    invalidate_article_responses(article_id)
+    
     # Add details about what was stored
-    if title_embedding:
+    if has_embedding:
         response_data["embedding_stored"] = True
-        response_data["embedding_dimensions"] = len(title_embedding) if isinstance(title_embedding, list) else None
+        response_data["embedding_dimensions"] = len(title_embedding if has_title_embedding else summary_embedding)
     if summary:
         response_data["summary_stored"] = True
         response_data["summary_length"] = len(summary) if summary else 0
@@ -1665,10 +1986,10 @@ async def update_article_processing_status(
     return response_data
 
 @app.post("/api/internal/articles/{article_id}/derivatives")
-async def create_article_derivatives(
+def create_article_derivatives(
     article_id: int,
     derivatives_data: dict,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API for postprocess: Store AI-generated article derivatives."""
     
@@ -1683,51 +2004,110 @@ async def create_article_derivatives(
     summary_embedding = derivatives_data.get("summary_embedding")
     llm_model_version = derivatives_data.get("llm_model_version")
     embedding_model_version = derivatives_data.get("embedding_model_version")
+    has_embeddings = bool(title_embedding and summary_embedding)
     
-    # Create or update RSSItemDerivative
-    # First check if derivative already exists
-    from sqlalchemy.orm import Session
-    from newsfrontier_lib.models import RSSItemDerivative
-    
-    existing_derivative = db.query(RSSItemDerivative).filter(
-        RSSItemDerivative.rss_item_id == article_id
-    ).first()
+    # Embeddings are stored at unit length so similarity is a plain dot product
+    if title_embedding:
+        title_embedding = normalize_embedding(title_embedding)
+    if summary_embedding:
+        summary_embedding = normalize_embedding(summary_embedding)
     
+    # Create or update RSSItemDerivative; both timestamps share one clock read
+    now = datetime.utcnow()
     derivative_data = {
         "rss_item_id": article_id,
         "summary": summary,
         "title_embedding": title_embedding,
         "summary_embedding": summary_embedding,
         "processing_status": "completed" if summary else "failed",
-        "summary_generated_at": datetime.utcnow() if summary else None,
-        "embeddings_generated_at": datetime.utcnow() if (title_embedding and summary_embedding) else None,
+        "summary_generated_at": now if summary else None,
+        "embeddings_generated_at": now if has_embeddings else None,
         "llm_model_version": llm_model_version,
         "embedding_model_version": embedding_model_version
     }
     
-    if existing_derivative:
-        # Update existing
-        for field, value in derivative_data.items():
-            if field != "rss_item_id":  # Don't update the primary key relationship
-                setattr(existing_derivative, field, value)
-        db.commit()
-        db.refresh(existing_derivative)
-    else:
-        # Create new
-        derivative = RSSItemDerivative(**derivative_data)
-        db.add(derivative)
+    # Insert, or overwrite the existing derivative, in one atomic statement
+    insert_stmt = pg_insert(RSSItemDerivative).values(**derivative_data)
+    try:
+        db.execute(insert_stmt.on_conflict_do_update(
+            index_elements=[RSSItemDerivative.rss_item_id],
+            set_={
+                field: insert_stmt.excluded[field]
+                for field in derivative_data if field != "rss_item_id"  # Don't update the primary key relationship
+            }
+        ))
         db.commit()
-        db.refresh(derivative)
+    except Exception:
+        db.rollback()
+        raise
+    
+    invalidate_article_responses(article_id)
     
     return {
         "message": "Article derivatives created successfully",
         "article_id": article_id,
         "has_summary": bool(summary),
-        "has_embeddings": bool(title_embedding and summary_embedding)
+        "has_embeddings": has_embeddings
+    }
+
+# System settings change only through the admin endpoint but are read on every
+# postprocess iteration; rows are cached by key as plain dicts. The cache is per
+# process: an admin write drops entries only in the worker that handled it, so
+# other workers can keep serving the old value for up to the TTL (60s). Settings
+# are tuning values read in polling loops, so that delay is accepted.
+_settings_cache = TTLCache(maxsize=512, ttl=60)
+_settings_cache_lock = threading.Lock()
+
+def setting_to_dict(setting) -> dict:
+    return {
+        "setting_key": setting.setting_key,
+        "setting_value": setting.setting_value,
+        "setting_type": setting.setting_type,
+        "description": setting.description,
+        "is_public": setting.is_public
+    }
+
+def cached_setting(db, key: str) -> Optional[dict]:
+    """Look up a system setting by key, serving repeat reads from the in-process cache."""
+    with _settings_cache_lock:
+        cached = _settings_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    setting = crud.system_setting.get_by_key(db, key=key)
+    if not setting:
+        return None
+    
+    cached = setting_to_dict(setting)
+    with _settings_cache_lock:
+        _settings_cache[key] = cached
+    return cached
+
+def cached_settings(db, keys: List[str]) -> Dict[str, dict]:
+    """Look up several system settings, fetching every cache miss in a single query."""
+    with _settings_cache_lock:
+        found = {key: _settings_cache.get(key) for key in keys}
+    found = {key: setting for key, setting in found.items() if setting is not None}
+    missing = [key for key in keys if key not in found]
+    if not missing:
+        return found
+    
+    loaded = {
+        key: setting_to_dict(setting)
+        for key, setting in crud.system_setting.get_many_by_keys(db, keys=missing).items()
     }
+    with _settings_cache_lock:
+        _settings_cache.update(loaded)
+    found.update(loaded)
+    return found
+
+def invalidate_cached_settings(keys: List[str]):
+    with _settings_cache_lock:
+        for key in keys:
+            _settings_cache.pop(key, None)
 
 @app.get("/api/internal/prompts")
-async def get_prompts(db = Depends(get_session)):
+def get_prompts(db = Depends(get_session_async)):
     """Internal API for postprocess: Get AI processing prompts."""
     
     prompt_keys = [
@@ -1737,27 +2117,33 @@ async def get_prompts(db = Depends(get_session)):
         'prompt_cover_image_generation'
     ]
     
-    # Get all prompt settings from database and return as dictionary
-    prompts = {}
-    for key in prompt_keys:
-        setting = crud.system_setting.get_by_key(db, key=key)
-        if setting:
-            prompts[setting.setting_key] = setting.setting_value
-    
-    return prompts
+    # Get all prompt settings (cached, misses in one query) and return as dictionary
+    settings = cached_settings(db, prompt_keys)
+    return {key: settings[key]["setting_value"] for key in prompt_keys if key in settings}
 
 @app.get("/api/internal/topics")
-async def get_all_topics_internal(
+def get_all_topics_internal(
     user_id: Optional[int] = None, 
-    db = Depends(get_session)
+    format: Literal["json", "bin"] = "json",
+    include_embeddings: bool = True,
+    db = Depends(get_session_async)
 ):
-    """Internal API for postprocess: Get all topics with embeddings."""
+    """Internal API for postprocess: Get all topics with embeddings.
     
-    # Get topics from database with optional user filtering
-    if user_id:
-        topics = crud.topic.get_user_topics(db, user_id=user_id)
-    else:
-        topics = crud.topic.get_multi(db, limit=1000)
+    format=bin returns only the topic vectors as packed float32 bytes (see
+    pack_embedding_matrix); include_embeddings=false drops them from the JSON.
+    """
+    
+    # Get topics from database with optional user filtering; only the returned
+    # columns are selected, so no Topic instances are built
+    if format == "bin":
+        topics = crud.topic.user_topics_query(db, Topic.id, Topic.topic_vector, user_id=user_id)
+        return embedding_matrix_response([(topic.id, topic.topic_vector) for topic in topics])
+    
+    columns = [Topic.id, Topic.name, Topic.user_id, Topic.is_active, Topic.created_at, Topic.updated_at]
+    if include_embeddings:
+        columns.append(Topic.topic_vector)
+    topics = crud.topic.user_topics_query(db, *columns, user_id=user_id)
     
     result = []
     for topic in topics:
@@ -1766,22 +2152,22 @@ async def get_all_topics_internal(
             "name": topic.name,
             "user_id": topic.user_id,
             "is_active": topic.is_active,
-            "created_at": topic.created_at.isoformat() if topic.created_at else None,
-            "updated_at": topic.updated_at.isoformat() if topic.updated_at else None
+            "created_at": topic.created_at,
+            "updated_at": topic.updated_at
         }
         
-        # Include topic vector (embedding) if available
-        if hasattr(topic, 'topic_vector') and topic.topic_vector is not None:
-            topic_data["topic_vector"] = topic.topic_vector.tolist()
+        # Include topic vector (embedding) if available; orjson writes the numpy array directly
+        if include_embeddings and topic.topic_vector is not None:
+            topic_data["topic_vector"] = topic.topic_vector
         
         result.append(topic_data)
     
-    return result
+    return ORJSONResponse(result)
 
 @app.post("/api/internal/topics/similar")
-async def find_similar_topics(
+def find_similar_topics(
     similarity_data: dict,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Find topics similar to given embedding."""
     embedding = similarity_data.get("embedding")
@@ -1791,42 +2177,45 @@ async def find_similar_topics(
     if not embedding:
         raise HTTPException(status_code=400, detail="Embedding is required")
     
-    # Convert to numpy array if needed
-    import numpy as np
-    if isinstance(embedding, list):
-        embedding = np.array(embedding)
-    
-    # Get topics for user
-    if user_id:
-        topics = crud.topic.get_user_topics(db, user_id=user_id)
+    rows, matrix, index = get_topic_matrix(db, user_id)
+    if matrix is None:
+        return []
+    
+    query = np.asarray(embedding, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    if query_norm == 0:
+        return []
+    query = query / query_norm
+    
+    if index is not None:
+        # range_search keeps scores strictly above the radius, so step just below
+        # the threshold to keep the inclusive comparison
+        radius = float(np.nextafter(np.float32(threshold), np.float32(-np.inf)))
+        _, hit_scores, hits = index.range_search(query.reshape(1, -1), radius)
     else:
-        topics = crud.topic.get_multi(db, limit=1000)
+        # One matrix-vector product scores every topic against the unit query vector
+        scores = matrix @ query
+        hits = np.where(scores >= threshold)[0]
+        hit_scores = scores[hits]
     
-    similar_topics = []
-    for topic in topics:
-        if hasattr(topic, 'topic_vector') and topic.topic_vector is not None:
-            # Calculate cosine similarity
-            topic_vec = topic.topic_vector
-            similarity = np.dot(embedding, topic_vec) / (np.linalg.norm(embedding) * np.linalg.norm(topic_vec))
-            
-            if similarity >= threshold:
-                similar_topics.append({
-                    "id": topic.id,
-                    "name": topic.name,
-                    "user_id": topic.user_id,
-                    "similarity": float(similarity),
-                    "is_active": topic.is_active
-                })
+    # Highest similarity first
+    order = np.argsort(-hit_scores, kind="stable")
     
-    # Sort by similarity (highest first)
-    similar_topics.sort(key=lambda x: x["similarity"], reverse=True)
-    
-    return similar_topics
+    return [
+        {
+            "id": rows[hits[i]][0],
+            "name": rows[hits[i]][1],
+            "user_id": rows[hits[i]][2],
+            "similarity": float(hit_scores[i]),
+            "is_active": rows[hits[i]][3]
+        }
+        for i in order
+    ]
 
 @app.get("/api/internal/topics/{topic_id}/events")
-async def get_events_by_topic(
+def get_events_by_topic(
     topic_id: int,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Get events for a specific topic."""
     
@@ -1836,11 +2225,13 @@ async def get_events_by_topic(
         raise HTTPException(status_code=404, detail="Topic not found")
     
     # Get events related to this topic through article-topic relationships
-    from sqlalchemy.orm import joinedload
-    from sqlalchemy import and_
     
-    # Query events that have articles associated with this topic
-    events_query = db.query(Event).join(
+    # Query events that have articles associated with this topic. Only the
+    # returned columns are selected, so DISTINCT doesn't compare embeddings
+    # and no ORM instances are built
+    events_query = db.query(
+        Event.id, Event.title, Event.description, Event.created_at, Event.updated_at
+    ).join(
         ArticleEvent, Event.id == ArticleEvent.event_id
     ).join(
         ArticleTopic, ArticleEvent.rss_item_id == ArticleTopic.rss_item_id
@@ -1862,7 +2253,7 @@ async def get_events_by_topic(
     ]
 
 @app.get("/api/internal/article-topics")
-async def get_article_topics(
+def get_article_topics(
     rss_item_id: Optional[int] = None,
     topic_id: Optional[int] = None,
     min_relevance_score: Optional[float] = None,
@@ -1870,20 +2261,30 @@ async def get_article_topics(
     date: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Search article-topics with filters."""
     
     # If date filter is provided, need to filter by article publication date
     if date:
         try:
-            from datetime import datetime, timedelta
             date_obj = datetime.strptime(date, "%Y-%m-%d").date()
             start_datetime = datetime.combine(date_obj, datetime.min.time())
             end_datetime = start_datetime + timedelta(days=1)
             
-            # Query with date filtering on related RSS items
-            query = db.query(ArticleTopic).join(RSSItemMetadata)
+            # Resolve the publication window to article ids first (an index-only
+            # range scan) instead of joining the whole metadata table; related
+            # rows load in one extra query apiece, not one per row
+            published_ids = db.query(RSSItemMetadata.id).filter(
+                RSSItemMetadata.published_at >= start_datetime,
+                RSSItemMetadata.published_at < end_datetime
+            )
+            query = db.query(ArticleTopic).filter(
+                ArticleTopic.rss_item_id.in_(published_ids.scalar_subquery())
+            ).options(
+                selectinload(ArticleTopic.rss_item),
+                selectinload(ArticleTopic.topic)
+            )
             
             if rss_item_id:
                 query = query.filter(ArticleTopic.rss_item_id == rss_item_id)
@@ -1894,12 +2295,6 @@ async def get_article_topics(
             if max_relevance_score is not None:
                 query = query.filter(ArticleTopic.relevance_score <= max_relevance_score)
             
-            # Filter by article publication date
-            query = query.filter(
-                RSSItemMetadata.published_at >= start_datetime,
-                RSSItemMetadata.published_at < end_datetime
-            )
-            
             article_topics = query.order_by(ArticleTopic.created_at.desc()).offset(offset).limit(limit).all()
         except Exception as e:
             logger.error(f"Error parsing date filter: {e}")
@@ -1913,7 +2308,8 @@ async def get_article_topics(
             min_relevance_score=min_relevance_score,
             max_relevance_score=max_relevance_score,
             limit=limit,
-            offset=offset
+            offset=offset,
+            with_related=True
         )
     
     result = []
@@ -1926,7 +2322,7 @@ async def get_article_topics(
         }
         
         # Include related topic if available
-        if hasattr(at, 'topic') and at.topic:
+        if at.topic:
             at_data["topic"] = {
                 "id": at.topic.id,
                 "name": at.topic.name,
@@ -1935,7 +2331,7 @@ async def get_article_topics(
             }
         
         # Include related article if available  
-        if hasattr(at, 'rss_item') and at.rss_item:
+        if at.rss_item:
             at_data["rss_item"] = {
                 "id": at.rss_item.id,
                 "title": at.rss_item.title,
@@ -1948,9 +2344,9 @@ async def get_article_topics(
     return result
 
 @app.post("/api/internal/article-topics")
-async def create_article_topic(
+def create_article_topic(
     article_topic_data: ArticleTopicData,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Create new article-topic relationship."""
     
@@ -1997,15 +2393,77 @@ async def create_article_topic(
         "created_at": article_topic.created_at.isoformat()
     }
 
+@app.post("/api/internal/article-topics/bulk")
+def create_article_topics_bulk(
+    article_topics_data: List[ArticleTopicData],
+    db = Depends(get_session_async)
+):
+    """Internal API: Create many article-topic relationships in one transaction.
+    
+    Pairs that already exist (or repeat within the request) are skipped
+    instead of failing the batch.
+    """
+    
+    # De-duplicate on the primary key, keeping the first score sent for a pair
+    rows = {}
+    for item in article_topics_data:
+        rows.setdefault((item.rss_item_id, item.topic_id), item.relevance_score)
+    if not rows:
+        return {"message": "No article-topic relationships to create", "created": [], "created_count": 0, "skipped_count": 0}
+    
+    # Verify every referenced article and topic with one query each
+    article_ids = {rss_item_id for rss_item_id, _ in rows}
+    topic_ids = {topic_id for _, topic_id in rows}
+    found_articles = {row_id for (row_id,) in db.query(RSSItemMetadata.id).filter(RSSItemMetadata.id.in_(article_ids))}
+    if found_articles != article_ids:
+        raise HTTPException(status_code=404, detail=f"Articles not found: {sorted(article_ids - found_articles)}")
+    found_topics = {row_id for (row_id,) in db.query(Topic.id).filter(Topic.id.in_(topic_ids))}
+    if found_topics != topic_ids:
+        raise HTTPException(status_code=404, detail=f"Topics not found: {sorted(topic_ids - found_topics)}")
+    
+    insert_stmt = pg_insert(ArticleTopic).values([
+        {"rss_item_id": rss_item_id, "topic_id": topic_id, "relevance_score": relevance_score}
+        for (rss_item_id, topic_id), relevance_score in rows.items()
+    ]).on_conflict_do_nothing().returning(
+        ArticleTopic.rss_item_id, ArticleTopic.topic_id, ArticleTopic.relevance_score, ArticleTopic.created_at
+    )
+    try:
+        created = db.execute(insert_stmt).all()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
+    return {
+        "message": f"Created {len(created)} article-topic relationships",
+        "created": [
+            {
+                "rss_item_id": row.rss_item_id,
+                "topic_id": row.topic_id,
+                "relevance_score": row.relevance_score,
+                "created_at": row.created_at.isoformat()
+            }
+            for row in created
+        ],
+        "created_count": len(created),
+        "skipped_count": len(article_topics_data) - len(created)
+    }
+
 # Internal Events (Clusters) API
 @app.get("/api/internal/events")
-async def get_events_internal(
+def get_events_internal(
     user_id: Optional[int] = None,
     topic_id: Optional[int] = None,
     created_date: Optional[str] = None,
-    db = Depends(get_session)
+    format: Literal["json", "bin"] = "json",
+    include_embeddings: bool = True,
+    db = Depends(get_session_async)
 ):
-    """Internal API: Get event clusters filtered by user and/or topic."""
+    """Internal API: Get event clusters filtered by user and/or topic.
+    
+    format=bin returns only the event embeddings as packed float32 bytes (see
+    pack_embedding_matrix); include_embeddings=false drops them from the JSON.
+    """
     
     query = db.query(Event)
     
@@ -2017,7 +2475,6 @@ async def get_events_internal(
     # Add date filtering if provided
     if created_date:
         try:
-            from datetime import datetime, timedelta
             date_obj = datetime.strptime(created_date, "%Y-%m-%d").date()
             start_datetime = datetime.combine(date_obj, datetime.min.time())
             end_datetime = start_datetime + timedelta(days=1)
@@ -2032,7 +2489,10 @@ async def get_events_internal(
     
     events = query.order_by(Event.updated_at.desc()).all()
     
-    return [
+    if format == "bin":
+        return embedding_matrix_response([(event.id, event.event_embedding) for event in events])
+    
+    return ORJSONResponse([
         {
             "id": event.id,
             "user_id": event.user_id,
@@ -2040,18 +2500,18 @@ async def get_events_internal(
             "title": event.title,
             "description": event.description,
             "event_description": event.event_description,
-            "event_embedding": event.event_embedding.tolist() if event.event_embedding is not None else None,
-            "created_at": event.created_at.isoformat(),
-            "updated_at": event.updated_at.isoformat(),
-            "last_updated_at": event.last_updated_at.isoformat()
+            "event_embedding": event.event_embedding if include_embeddings else None,
+            "created_at": event.created_at,
+            "updated_at": event.updated_at,
+            "last_updated_at": event.last_updated_at
         }
         for event in events
-    ]
+    ])
 
 @app.post("/api/internal/events")
-async def create_event_internal(
+def create_event_internal(
     event_data: EventData,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Create new event cluster."""
     
@@ -2073,12 +2533,17 @@ async def create_event_internal(
     # Generate embedding for event_description if provided
     event_embedding = None
     if event_data.event_description:
-        try:
-            from newsfrontier_lib import generate_content_embedding
-            event_embedding = generate_content_embedding(title, event_data.event_description)
-            event_embedding = event_embedding.tolist() if hasattr(event_embedding, 'tolist') else event_embedding
-        except Exception as e:
-            logger.error(f"Failed to generate event embedding: {e}")
+        cache_key = embedding_cache_key("event", title, event_data.event_description)
+        event_embedding = get_cached_embedding(cache_key)
+        if event_embedding is None:
+            try:
+                event_embedding = generate_content_embedding(title, event_data.event_description)
+                if event_embedding is not None and len(event_embedding) > 0:
+                    # Stored at unit length so similarity is a plain dot product
+                    event_embedding = normalize_embedding(event_embedding)
+                    cache_embedding(cache_key, event_embedding)
+            except Exception as e:
+                logger.error(f"Failed to generate event embedding: {e}")
     
     # Create event
     event_create_data = {
@@ -2092,23 +2557,24 @@ async def create_event_internal(
     
     event = crud.event.create(db, obj_in=event_create_data)
     
-    return {
+    # orjson writes the numpy embedding directly, no per-element Python floats
+    return ORJSONResponse({
         "id": event.id,
         "user_id": event.user_id,
         "topic_id": event.topic_id,
         "title": event.title,
         "description": event.description,
         "event_description": event.event_description,
-        "event_embedding": event.event_embedding.tolist() if event.event_embedding is not None else None,
-        "created_at": event.created_at.isoformat(),
-        "updated_at": event.updated_at.isoformat(),
-        "last_updated_at": event.last_updated_at.isoformat()
-    }
+        "event_embedding": event.event_embedding,
+        "created_at": event.created_at,
+        "updated_at": event.updated_at,
+        "last_updated_at": event.last_updated_at
+    })
 
 @app.post("/api/internal/article-events")
-async def create_article_event_internal(
+def create_article_event_internal(
     article_event_data: ArticleEventData,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Create new article-event relationship."""
     
@@ -2162,31 +2628,96 @@ async def create_article_event_internal(
         "created_at": article_event.created_at.isoformat()
     }
 
-@app.get("/api/internal/articles/completed")
-async def get_completed_articles_internal(
-    limit: int = 1000,
-    db = Depends(get_session)
+@app.post("/api/internal/article-events/bulk")
+def create_article_events_bulk(
+    article_events_data: List[ArticleEventData],
+    db = Depends(get_session_async)
 ):
-    """Internal API: Get articles that have been completed with derivatives."""
-    articles = crud.rss_item.get_completed_articles(db, limit=limit)
+    """Internal API: Create many article-event relationships in one transaction.
+    
+    Pairs that already exist (or repeat within the request) are skipped
+    instead of failing the batch.
+    """
+    
+    # De-duplicate on the primary key, keeping the first score sent for a pair
+    rows = {}
+    for item in article_events_data:
+        rows.setdefault((item.rss_item_id, item.event_id), item.relevance_score)
+    if not rows:
+        return {"message": "No article-event relationships to create", "created": [], "created_count": 0, "skipped_count": 0}
+    
+    # Verify every referenced article and event with one query each
+    article_ids = {rss_item_id for rss_item_id, _ in rows}
+    event_ids = {event_id for _, event_id in rows}
+    found_articles = {row_id for (row_id,) in db.query(RSSItemMetadata.id).filter(RSSItemMetadata.id.in_(article_ids))}
+    if found_articles != article_ids:
+        raise HTTPException(status_code=404, detail=f"Articles not found: {sorted(article_ids - found_articles)}")
+    found_events = {row_id for (row_id,) in db.query(Event.id).filter(Event.id.in_(event_ids))}
+    if found_events != event_ids:
+        raise HTTPException(status_code=404, detail=f"Events not found: {sorted(event_ids - found_events)}")
+    
+    insert_stmt = pg_insert(ArticleEvent).values([
+        {"rss_item_id": rss_item_id, "event_id": event_id, "relevance_score": relevance_score}
+        for (rss_item_id, event_id), relevance_score in rows.items()
+    ]).on_conflict_do_nothing().returning(
+        ArticleEvent.rss_item_id, ArticleEvent.event_id, ArticleEvent.relevance_score, ArticleEvent.created_at
+    )
+    try:
+        created = db.execute(insert_stmt).all()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
     return {
-        "data": [
+        "message": f"Created {len(created)} article-event relationships",
+        "created": [
             {
-                "id": article.id,
-                "title": article.title,
-                "content": article.content,
-                "url": article.url,
-                "published_at": article.published_at.isoformat() if article.published_at else None,
-                "processing_status": article.processing_status
+                "rss_item_id": row.rss_item_id,
+                "event_id": row.event_id,
+                "relevance_score": row.relevance_score,
+                "created_at": row.created_at.isoformat()
             }
-            for article in articles
-        ]
+            for row in created
+        ],
+        "created_count": len(created),
+        "skipped_count": len(article_events_data) - len(created)
     }
 
+def stream_completed_articles(limit: int):
+    """Yield completed articles as newline-delimited JSON, one article per line."""
+    # Same as stream_pending_articles: the generator owns its session and cursor
+    with get_default_session_maker()() as db:
+        rows = crud.rss_item.completed_articles_query(
+            db,
+            RSSItemMetadata.id, RSSItemMetadata.title, RSSItemMetadata.content, RSSItemMetadata.url,
+            RSSItemMetadata.published_at, RSSItemMetadata.processing_status,
+            limit=limit
+        ).execution_options(stream_results=True, yield_per=200)
+        
+        for row in rows:
+            yield orjson.dumps({
+                "id": row.id,
+                "title": row.title,
+                "content": row.content,
+                "url": row.url,
+                "published_at": row.published_at,
+                "processing_status": row.processing_status
+            }) + b"\n"
+
+@app.get("/api/internal/articles/completed")
+def get_completed_articles_internal(limit: int = 1000):
+    """Internal API: Get articles that have been completed with derivatives.
+    
+    Streams NDJSON (one article object per line) so up to a thousand full
+    article bodies never sit in memory at once.
+    """
+    return StreamingResponse(stream_completed_articles(limit), media_type="application/x-ndjson")
+
 @app.get("/api/internal/article/{article_id}")
-async def get_article_detail_internal(
+def get_article_detail_internal(
     article_id: int,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Get full article details including derivatives."""
     article = crud.rss_item.get(db, id=article_id)
@@ -2196,31 +2727,31 @@ async def get_article_detail_internal(
     # Get derivatives
     derivatives = crud.rss_item_derivative.get_by_article_id(db, rss_item_id=article_id)
     
-    return {
+    return ORJSONResponse({
         "id": article.id,
         "title": article.title,
         "content": article.content,
         "url": article.url,
-        "published_at": article.published_at.isoformat() if article.published_at else None,
+        "published_at": article.published_at,
         "processing_status": article.processing_status,
         "derivatives": [
             {
                 "id": deriv.id,
                 "summary": deriv.summary,
-                "title_embedding": deriv.title_embedding.tolist(),
-                "summary_embedding": deriv.summary_embedding.tolist(),
+                "title_embedding": deriv.title_embedding,
+                "summary_embedding": deriv.summary_embedding,
                 "processing_status": deriv.processing_status,
-                "summary_generated_at": deriv.summary_generated_at.isoformat() if deriv.summary_generated_at else None,
-                "embeddings_generated_at": deriv.embeddings_generated_at.isoformat() if deriv.embeddings_generated_at else None
+                "summary_generated_at": deriv.summary_generated_at,
+                "embeddings_generated_at": deriv.embeddings_generated_at
             }
             for deriv in derivatives
         ]
-    }
+    })
 
 @app.get("/api/internal/articles/{article_id}")
-async def get_article_detail_internal_plural(
+def get_article_detail_internal_plural(
     article_id: int,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Get article details (plural endpoint for compatibility)."""
     # Reuse the same logic as the singular version
@@ -2243,7 +2774,7 @@ async def get_article_detail_internal_plural(
 
 # Daily Summary Internal API Endpoints
 @app.get("/api/internal/users")
-async def get_all_users_internal(db = Depends(get_session)):
+def get_all_users_internal(db = Depends(get_session_async)):
     """Internal API: Get all users for daily summary generation."""
     try:
         users = crud.user.get_multi(db, limit=10000)
@@ -2263,7 +2794,7 @@ async def get_all_users_internal(db = Depends(get_session)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/internal/user/{user_id}")
-async def get_user_internal(user_id: int, db = Depends(get_session)):
+def get_user_internal(user_id: int, db = Depends(get_session_async)):
     """Internal API: Get user details by ID."""
     try:
         user = crud.user.get(db, user_id)
@@ -2284,17 +2815,15 @@ async def get_user_internal(user_id: int, db = Depends(get_session)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/internal/user-summaries/{user_id}")
-async def get_user_summaries_internal(
+def get_user_summaries_internal(
     user_id: int,
     limit: int = 10,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Get recent daily summaries for a user."""
     try:
-        summaries = crud.user_summary.get_recent_summaries(db, user_id=user_id, days=30)
-        
-        # Sort by date descending and limit
-        sorted_summaries = sorted(summaries, key=lambda x: x.date, reverse=True)[:limit]
+        # Newest first, limited in SQL so only the returned rows are fetched
+        summaries = crud.user_summary.get_recent_summaries(db, user_id=user_id, days=30, limit=limit)
         
         return {
             "data": [
@@ -2309,7 +2838,7 @@ async def get_user_summaries_internal(
                     "cover_s3key": summary.cover_s3key,
                     "created_at": summary.created_at.isoformat() if summary.created_at else None
                 }
-                for summary in sorted_summaries
+                for summary in summaries
             ]
         }
     except Exception as e:
@@ -2317,14 +2846,13 @@ async def get_user_summaries_internal(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/internal/user-summary/{user_id}/{date}")
-async def get_user_summary_by_date_internal(
+def get_user_summary_by_date_internal(
     user_id: int,
     date: str,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Check if daily summary exists for user on specific date."""
     try:
-        from datetime import datetime
         date_obj = datetime.strptime(date, "%Y-%m-%d").date()
         
         summary = crud.user_summary.get_by_date(db, user_id=user_id, date=date_obj)
@@ -2349,13 +2877,12 @@ async def get_user_summary_by_date_internal(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.post("/api/internal/user-summaries")
-async def create_user_summary_internal(
+def create_user_summary_internal(
     request: DailySummaryCreateRequest,
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Internal API: Create new daily summary."""
     try:
-        from datetime import datetime
         date_obj = datetime.strptime(request.date, "%Y-%m-%d").date()
         
         # Check if summary already exists
@@ -2394,20 +2921,14 @@ async def create_user_summary_internal(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/internal/system-settings/{setting_key}")
-async def get_system_setting_internal(setting_key: str, db = Depends(get_session)):
+def get_system_setting_internal(setting_key: str, db = Depends(get_session_async)):
     """Internal API: Get a specific system setting by key."""
     try:
-        setting = crud.system_setting.get_by_key(db, key=setting_key)
+        setting = cached_setting(db, setting_key)
         if not setting:
             raise HTTPException(status_code=404, detail=f"System setting '{setting_key}' not found")
         
-        return {
-            "setting_key": setting.setting_key,
-            "setting_value": setting.setting_value,
-            "setting_type": setting.setting_type,
-            "description": setting.description,
-            "is_public": setting.is_public
-        }
+        return setting
     except HTTPException:
         raise
     except Exception as e:
@@ -2415,126 +2936,91 @@ async def get_system_setting_internal(setting_key: str, db = Depends(get_session
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Admin System Settings API
-@app.get("/api/admin/system-settings", response_model=List[SystemSettingResponse])
-async def get_system_settings(admin_user = Depends(verify_admin), db = Depends(get_session)):
+@app.get("/api/admin/system-settings", response_model=None, responses={200: {"model": List[SystemSettingResponse]}}, response_class=ORJSONResponse)
+def get_system_settings(admin_user = Depends(verify_admin), db = Depends(get_session_async)):
     """Get all system settings (Admin only)."""
     logger.info(f"Admin user {admin_user.username} requesting system settings")
     
     # Get all system settings from database
     settings = crud.system_setting.get_multi(db, limit=1000)  # Get all settings with generous limit
     
-    return [
-        SystemSettingResponse(
-            id=setting.id,
-            setting_key=setting.setting_key,
-            setting_value=setting.setting_value,
-            setting_type=setting.setting_type,
-            description=setting.description,
-            is_public=setting.is_public,
-            updated_at=setting.updated_at.isoformat() if setting.updated_at else "",
-            created_at=setting.created_at.isoformat() if setting.created_at else ""
-        )
+    # Build plain dicts and hand them to orjson directly; returning a Response
+    # skips FastAPI's jsonable_encoder walk over every row
+    return ORJSONResponse([
+        {
+            "id": setting.id,
+            "setting_key": setting.setting_key,
+            "setting_value": setting.setting_value,
+            "setting_type": setting.setting_type,
+            "description": setting.description,
+            "is_public": setting.is_public,
+            "updated_at": setting.updated_at.isoformat() if setting.updated_at else "",
+            "created_at": setting.created_at.isoformat() if setting.created_at else ""
+        }
         for setting in settings
-    ]
+    ])
+
+# frozenset gives an O(1) membership test
+BOOLEAN_SETTING_VALUES = frozenset({'true', 'false'})
+
+def _integer_setting_error(value: str) -> Optional[str]:
+    try:
+        int(value)
+    except ValueError:
+        return "Invalid integer value"
+    return None
+
+def _float_setting_error(value: str) -> Optional[str]:
+    try:
+        float(value)
+    except ValueError:
+        return "Invalid float value"
+    return None
+
+def _boolean_setting_error(value: str) -> Optional[str]:
+    return None if value.lower() in BOOLEAN_SETTING_VALUES else "Boolean value must be 'true' or 'false'"
+
+def _json_setting_error(value: str) -> Optional[str]:
+    try:
+        json.loads(value)
+    except json.JSONDecodeError:
+        return "Invalid JSON value"
+    return None
+
+# One validator per SettingType; each returns an error message, or None if the value is valid
+SETTING_VALUE_VALIDATORS = {
+    'string': lambda value: None,
+    'integer': _integer_setting_error,
+    'float': _float_setting_error,
+    'boolean': _boolean_setting_error,
+    'json': _json_setting_error,
+}
 
 @app.put("/api/admin/system-settings")
-async def update_system_settings(
+def update_system_settings(
     settings_updates: List[SystemSettingUpdate],
     admin_user = Depends(verify_admin), 
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Update multiple system settings (Admin only)."""
     logger.info(f"Admin user {admin_user.username} updating system settings")
     
     updated_count = 0
     failed_updates = []
+    valid_updates = []
     
     for update in settings_updates:
         try:
-            # Validate setting type
-            if update.setting_type not in ['string', 'integer', 'boolean', 'json', 'float']:
+            # Type validation through the per-type validator table
+            error = SETTING_VALUE_VALIDATORS[update.setting_type](update.setting_value)
+            if error:
                 failed_updates.append({
                     "setting_key": update.setting_key,
-                    "error": f"Invalid setting type: {update.setting_type}"
+                    "error": error
                 })
                 continue
             
-            # Type validation for specific types
-            if update.setting_type == 'integer':
-                try:
-                    int(update.setting_value)
-                except ValueError:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Invalid integer value"
-                    })
-                    continue
-            elif update.setting_type == 'float':
-                try:
-                    float(update.setting_value)
-                except ValueError:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Invalid float value"
-                    })
-                    continue
-            elif update.setting_type == 'boolean':
-                if update.setting_value.lower() not in ['true', 'false']:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Boolean value must be 'true' or 'false'"
-                    })
-                    continue
-            elif update.setting_type == 'json':
-                try:
-                    json.loads(update.setting_value)
-                except json.JSONDecodeError:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Invalid JSON value"
-                    })
-                    continue
-            
-            # Get existing setting
-            existing_setting = crud.system_setting.get_by_key(db, key=update.setting_key)
-            
-            if existing_setting:
-                # Update existing setting
-                updated_setting = crud.system_setting.set_setting_value(
-                    db,
-                    key=update.setting_key,
-                    value=update.setting_value,
-                    setting_type=update.setting_type,
-                    updated_by=admin_user.id
-                )
-                if updated_setting:
-                    updated_count += 1
-                    logger.info(f"Updated setting: {update.setting_key} = {update.setting_value}")
-                else:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Failed to update setting"
-                    })
-            else:
-                # Create new setting (this should rarely happen as settings are pre-populated)
-                setting_data = {
-                    "setting_key": update.setting_key,
-                    "setting_value": update.setting_value,
-                    "setting_type": update.setting_type,
-                    "description": f"Custom setting: {update.setting_key}",
-                    "is_public": False,
-                    "updated_by": admin_user.id
-                }
-                
-                new_setting = crud.system_setting.create(db, obj_in=setting_data)
-                if new_setting:
-                    updated_count += 1
-                    logger.info(f"Created new setting: {update.setting_key} = {update.setting_value}")
-                else:
-                    failed_updates.append({
-                        "setting_key": update.setting_key,
-                        "error": "Failed to create new setting"
-                    })
+            valid_updates.append(update)
                     
         except Exception as e:
             logger.error(f"Error updating setting {update.setting_key}: {str(e)}")
@@ -2543,6 +3029,29 @@ async def update_system_settings(
                 "error": f"Unexpected error: {str(e)}"
             })
     
+    # Write all valid settings in a single transaction
+    if valid_updates:
+        try:
+            written_keys = crud.system_setting.set_many(
+                db,
+                items=[update.model_dump() for update in valid_updates],
+                updated_by=admin_user.id
+            )
+            updated_count = len(valid_updates)
+            # Settings resubmitted with their current value are valid but not rewritten
+            invalidate_cached_settings(written_keys)
+            logger.info(
+                "Admin %s saved %d settings, %d changed: %s",
+                admin_user.username, updated_count, len(written_keys), ", ".join(written_keys) or "none"
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error writing system settings: {str(e)}")
+            failed_updates.extend(
+                {"setting_key": update.setting_key, "error": f"Unexpected error: {str(e)}"}
+                for update in valid_updates
+            )
+    
     response = {
         "message": f"Updated {updated_count} settings successfully",
         "updated_count": updated_count,
@@ -2559,32 +3068,29 @@ async def update_system_settings(
 @app.post("/api/debug/regenerate-daily-summary")
 async def regenerate_daily_summary_debug(
     user_token = Depends(get_current_user),
-    db = Depends(get_session)
+    db = Depends(get_session_async)
 ):
     """Debug endpoint to trigger daily summary regeneration for current user."""
     try:
-        from datetime import datetime
-        import requests
-        
         user_id = user_token.id
         today = datetime.now().date()
         
         logger.info(f"Debug: Regenerating daily summary for user {user_id} on {today}")
         
-        # Delete existing summary for today if it exists
-        existing_summary = crud.user_summary.get_by_date(db, user_id=user_id, date=today)
-        if existing_summary:
-            crud.user_summary.remove(db, id=existing_summary.id)
-            logger.info(f"Debug: Deleted existing summary for user {user_id} on {today}")
+        # Delete existing summary for today if it exists; the ORM calls block,
+        # so they run in the threadpool rather than on the event loop
+        def delete_existing_summary():
+            existing_summary = crud.user_summary.get_by_date(db, user_id=user_id, date=today)
+            if existing_summary:
+                crud.user_summary.remove(db, id=existing_summary.id)
+                logger.info(f"Debug: Deleted existing summary for user {user_id} on {today}")
+        
+        await run_in_threadpool(delete_existing_summary)
         
         # Try to trigger postprocess service to regenerate summary
-        postprocess_url = os.getenv("POSTPROCESS_URL", "http://localhost:8001")
         try:
             # Call internal API to trigger summary generation for specific user
-            response = requests.post(
-                f"{postprocess_url}/api/generate-user-summary/{user_id}",
-                timeout=30
-            )
+            response = await postprocess_breaker.call(postprocess_client.post, f"/api/generate-user-summary/{user_id}")
             
             if response.status_code == 200:
                 logger.info(f"Debug: Successfully triggered summary regeneration for user {user_id}")
@@ -2603,7 +3109,7 @@ async def regenerate_daily_summary_debug(
                     "postprocess_triggered": False,
                     "postprocess_status": response.status_code
                 }
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.warning(f"Debug: Could not reach postprocess service: {e}")
             return {
                 "success": True,
@@ -2619,13 +3125,10 @@ async def regenerate_daily_summary_debug(
 
 @app.post("/api/debug/fetch-rss")
 async def fetch_rss_debug(
-    user_token = Depends(get_current_user),
-    db = Depends(get_session)
+    user_token = Depends(get_current_user)
 ):
     """Debug endpoint to trigger RSS feed collection."""
     try:
-        import requests
-        
         logger.info(f"Debug: Triggering RSS feed collection requested by user {user_token.id}")
         
         # For now, scraper service doesn't have API endpoints
@@ -2644,22 +3147,15 @@ async def fetch_rss_debug(
 
 @app.post("/api/debug/process-articles")
 async def process_articles_debug(
-    user_token = Depends(get_current_user),
-    db = Depends(get_session)
+    user_token = Depends(get_current_user)
 ):
     """Debug endpoint to trigger article processing."""
     try:
-        import requests
-        
         logger.info(f"Debug: Triggering article processing requested by user {user_token.id}")
         
         # Try to trigger postprocess service
-        postprocess_url = os.getenv("POSTPROCESS_URL", "http://localhost:8001")
         try:
-            response = requests.post(
-                f"{postprocess_url}/api/process",
-                timeout=120
-            )
+            response = await postprocess_breaker.call(postprocess_client.post, "/api/process", timeout=120)
             
             if response.status_code == 200:
                 logger.info("Debug: Successfully triggered article processing")
@@ -2676,7 +3172,7 @@ async def process_articles_debug(
                     "postprocess_triggered": False,
                     "postprocess_status": response.status_code
                 }
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.warning(f"Debug: Could not reach postprocess service: {e}")
             return {
                 "success": False,
@@ -2691,7 +3187,7 @@ async def process_articles_debug(
 
 # System Health and Status API
 @app.get("/api/system/health")
-async def get_system_health():
+def get_system_health():
     """System health check endpoint."""
     health_status = {
         "api": "healthy",
@@ -2709,58 +3205,54 @@ async def get_system_health():
     
     return health_status
 
+SYSTEM_STATS_QUERY = text("""
+    SELECT
+        (SELECT count(*) FROM rss_feeds) AS total_feeds,
+        (SELECT count(*) FROM rss_items_metadata) AS total_articles,
+        (SELECT count(*) FROM rss_items_metadata
+         WHERE processing_status = 'pending') AS articles_pending_processing,
+        (SELECT count(*) FROM rss_items_metadata
+         WHERE processing_completed_at >= :today_start AND processing_completed_at <= :today_end
+           AND processing_status = 'completed') AS articles_processed_today,
+        (SELECT count(DISTINCT u.id) FROM users u
+         JOIN rss_subscriptions s ON s.user_id = u.id
+         WHERE s.is_active = TRUE) AS active_users
+""")
+
 @app.get("/api/system/stats")
-async def get_system_stats(db = Depends(get_session)):
+def get_system_stats(db = Depends(get_session_async)):
     """Get system statistics for monitoring."""
     
-    from sqlalchemy import func, and_
-    from datetime import datetime, date
     
     # Calculate real statistics from database
     today = date.today()
     today_start = datetime.combine(today, datetime.min.time())
     today_end = datetime.combine(today, datetime.max.time())
     
-    # Total RSS feeds
-    total_feeds = db.query(func.count(RSSFeed.id)).scalar() or 0
-    
-    # Total articles
-    total_articles = db.query(func.count(RSSItemMetadata.id)).scalar() or 0
-    
-    # Articles pending processing
-    articles_pending_processing = db.query(func.count(RSSItemMetadata.id)).filter(
-        RSSItemMetadata.processing_status == 'pending'
-    ).scalar() or 0
-    
-    # Articles processed today
-    articles_processed_today = db.query(func.count(RSSItemMetadata.id)).filter(
-        and_(
-            RSSItemMetadata.processing_completed_at >= today_start,
-            RSSItemMetadata.processing_completed_at <= today_end,
-            RSSItemMetadata.processing_status == 'completed'
-        )
-    ).scalar() or 0
-    
-    # Active users (users who have logged in recently or have active subscriptions)
-    active_users = db.query(func.count(User.id.distinct())).join(RSSSubscription).filter(
-        RSSSubscription.is_active == True
-    ).scalar() or 0
+    # All five counts in one round-trip
+    stats = db.execute(SYSTEM_STATS_QUERY, {
+        "today_start": today_start,
+        "today_end": today_end
+    }).one()
     
     return {
-        "total_feeds": total_feeds,
-        "total_articles": total_articles,
-        "articles_pending_processing": articles_pending_processing,
-        "articles_processed_today": articles_processed_today,
-        "active_users": active_users,
+        "total_feeds": stats.total_feeds,
+        "total_articles": stats.total_articles,
+        "articles_pending_processing": stats.articles_pending_processing,
+        "articles_processed_today": stats.articles_processed_today,
+        "active_users": stats.active_users,
         "last_updated": datetime.utcnow().isoformat()
     }
 
 # Enhanced Topic Management endpoints removed - using main topic endpoints above
 
+# The health-check payload never changes, so serialize it once at import time
+ROOT_RESPONSE_BODY = orjson.dumps({"message": "NewsFrontier API is running"})
+
 @app.get("/")
 async def root():
     logger.info("Root endpoint accessed")
-    return {"message": "NewsFrontier API is running"}
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 @app.on_event("startup")
 async def startup_event():
@@ -2775,12 +3267,26 @@ async def startup_event():
         logger.error(f"❌ Database connection test failed: {str(e)}")
         logger.error(f"Stack trace: {traceback.format_exc()}")
         sys.exit(1)
+    
+    # passlib loads and self-tests the bcrypt backend on first use; do it now
+    # instead of inside the first login request
+    await run_in_threadpool(pwd_context.dummy_verify)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("🔄 NewsFrontier API is shutting down...")
+    await postprocess_client.aclose()
 
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting NewsFrontier API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="debug")
+    # uvloop/httptools ship with uvicorn[standard]; an import string is required for workers > 1
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="debug",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("API_WORKERS", os.cpu_count() or 1))
+    )
@@ -6,7 +6,7 @@ for the NewsFrontier news aggregation platform.
 """
 
 from .models import *
-from .database import get_database_url, create_engine, get_session, Base
+from .database import get_database_url, create_engine, get_session, get_session_async, Base
 from .schemas import *
 from . import crud
 from .urls import (
@@ -24,6 +24,12 @@ from .llm_client import (
     get_llm_client,
     generate_topic_embedding,
     generate_content_embedding,
+    normalize_embedding,
+    stack_normalized_embeddings,
+    encode_embedding,
+    decode_embedding,
+    pack_embedding_matrix,
+    unpack_embedding_matrix,
     create_summary
 )
 
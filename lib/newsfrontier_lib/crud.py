@@ -6,11 +6,12 @@ in the NewsFrontier application.
 """
 
 from typing import Generic, TypeVar, Type, List, Optional, Any, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, text
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, desc, asc, text, exists, tuple_
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import INTERVAL
+from sqlalchemy.dialects.postgresql import INTERVAL, insert as pg_insert
 from datetime import datetime, date, timedelta
+from uuid import UUID
 
 from .database import Base
 from .models import (
@@ -51,8 +52,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return query.offset(skip).limit(limit).all()
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        if hasattr(obj_in, 'dict'):
-            obj_in_data = obj_in.dict()
+        if hasattr(obj_in, 'model_dump'):
+            obj_in_data = obj_in.model_dump()
         else:
             obj_in_data = obj_in
         db_obj = self.model(**obj_in_data)
@@ -68,8 +69,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: UpdateSchemaType | Dict[str, Any]
     ) -> ModelType:
-        if hasattr(obj_in, 'dict'):
-            update_data = obj_in.dict(exclude_unset=True)
+        if hasattr(obj_in, 'model_dump'):
+            update_data = obj_in.model_dump(exclude_unset=True)
         else:
             update_data = obj_in
 
@@ -99,6 +100,19 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def get_by_username(self, db: Session, *, username: str) -> Optional[User]:
         return db.query(User).filter(User.username == username).first()
 
+    def find_conflicts(self, db: Session, *, username: str, email: str) -> set:
+        """Return which of username/email are already taken, in a single query."""
+        rows = db.query(User.username, User.email).filter(
+            or_(User.username == username, User.email == email)
+        ).limit(2).all()
+        conflicts = set()
+        for row in rows:
+            if row.username == username:
+                conflicts.add("username")
+            if row.email == email:
+                conflicts.add("email")
+        return conflicts
+
     def authenticate(self, db: Session, *, username: str, password_hash: str) -> Optional[User]:
         user = self.get_by_username(db, username=username)
         if not user:
@@ -117,7 +131,7 @@ class CRUDRSSFeed(CRUDBase[RSSFeed, dict, dict]):
     def get_by_url(self, db: Session, *, url: str) -> Optional[RSSFeed]:
         return db.query(RSSFeed).filter(RSSFeed.url == url).first()
 
-    def get_by_uuid(self, db: Session, *, uuid: str) -> Optional[RSSFeed]:
+    def get_by_uuid(self, db: Session, *, uuid: UUID) -> Optional[RSSFeed]:
         return db.query(RSSFeed).filter(RSSFeed.uuid == uuid).first()
 
     def get_feeds_due_for_fetch(self, db: Session) -> List[RSSFeed]:
@@ -169,7 +183,7 @@ class CRUDRSSItem(CRUDBase[RSSItemMetadata, dict, dict]):
         self, 
         db: Session, 
         *, 
-        rss_feed_uuid: str, 
+        rss_feed_uuid: UUID, 
         guid: str
     ) -> Optional[RSSItemMetadata]:
         """Check if article with same RSS feed UUID + guid already exists."""
@@ -180,16 +194,38 @@ class CRUDRSSItem(CRUDBase[RSSItemMetadata, dict, dict]):
             )
         ).first()
 
-    def get_pending_processing(self, db: Session, *, limit: int = 50) -> List[RSSItemMetadata]:
-        """Get articles that need AI processing."""
-        return db.query(RSSItemMetadata).filter(
+    def get_existing_feed_guids(
+        self, 
+        db: Session, 
+        *, 
+        pairs: List[tuple]
+    ) -> set:
+        """Return the (RSS feed UUID, guid) pairs among the candidates that already exist."""
+        if not pairs:
+            return set()
+        rows = db.query(RSSFeed.uuid, RSSItemMetadata.guid).select_from(RSSItemMetadata).join(
+            RSSFetchRecord, RSSFetchRecord.id == RSSItemMetadata.rss_fetch_record_id
+        ).join(
+            RSSFeed, RSSFeed.id == RSSFetchRecord.rss_feed_id
+        ).filter(
+            tuple_(RSSFeed.uuid, RSSItemMetadata.guid).in_(pairs)
+        ).all()
+        return {(feed_uuid, guid) for feed_uuid, guid in rows}
+
+    def pending_processing_query(self, db: Session, *entities, limit: int = 50):
+        """Query for articles that need AI processing; selects whole rows unless columns are given."""
+        return db.query(*(entities or (RSSItemMetadata,))).filter(
             or_(
                 RSSItemMetadata.processing_status == 'pending',
                 RSSItemMetadata.processing_status == 'failed'
             )
         ).filter(
             RSSItemMetadata.processing_attempts < 5
-        ).order_by(RSSItemMetadata.created_at.asc()).limit(limit).all()
+        ).order_by(RSSItemMetadata.created_at.asc()).limit(limit)
+
+    def get_pending_processing(self, db: Session, *, limit: int = 50) -> List[RSSItemMetadata]:
+        """Get articles that need AI processing."""
+        return self.pending_processing_query(db, limit=limit).all()
 
     def get_recent_articles(
         self, 
@@ -214,41 +250,86 @@ class CRUDRSSItem(CRUDBase[RSSItemMetadata, dict, dict]):
     ) -> RSSItemMetadata:
         item = self.get(db, item_id)
         if item:
-            # Only increment attempts for processing or failure
-            if status in ['processing', 'failed']:
-                item.processing_attempts += 1
-            
-            item.processing_status = status
-            
-            if status == 'processing':
-                item.processing_started_at = datetime.utcnow()
-            elif status in ['completed', 'failed']:
-                item.processing_completed_at = datetime.utcnow()
-                if error_message:
-                    item.last_error_message = error_message
-            
+            self.set_processing_status(item, status=status, error_message=error_message)
             db.commit()
             db.refresh(item)
         return item
 
+    def set_processing_status(
+        self, 
+        item: RSSItemMetadata, 
+        *, 
+        status: str,
+        error_message: str = None
+    ) -> RSSItemMetadata:
+        """Apply a processing status change to a loaded item without committing."""
+        # Only increment attempts for processing or failure
+        if status in ['processing', 'failed']:
+            item.processing_attempts += 1
+        
+        item.processing_status = status
+        
+        if status == 'processing':
+            item.processing_started_at = datetime.utcnow()
+        elif status in ['completed', 'failed']:
+            item.processing_completed_at = datetime.utcnow()
+            if error_message:
+                item.last_error_message = error_message
+        return item
+
+    def completed_articles_query(self, db: Session, *entities, limit: int = 1000):
+        """Query for articles that have completed processing; selects whole rows unless columns are given."""
+        return db.query(*(entities or (RSSItemMetadata,))).filter(
+            RSSItemMetadata.processing_status == 'completed'
+        ).order_by(RSSItemMetadata.created_at.desc()).limit(limit)
+
     def get_completed_articles(self, db: Session, *, limit: int = 1000) -> List[RSSItemMetadata]:
         """Get articles that have been completed processing."""
-        return db.query(RSSItemMetadata).filter(
-            RSSItemMetadata.processing_status == 'completed'
-        ).order_by(RSSItemMetadata.created_at.desc()).limit(limit).all()
+        return self.completed_articles_query(db, limit=limit).all()
 
 
 class CRUDTopic(CRUDBase[Topic, dict, dict]):
     def get_user_topics(self, db: Session, *, user_id: int) -> List[Topic]:
-        return db.query(Topic).filter(
-            and_(Topic.user_id == user_id, Topic.is_active == True)
-        ).order_by(Topic.created_at.desc()).all()
+        return self.user_topics_query(db, user_id=user_id).all()
+
+    def user_topics_query(self, db: Session, *entities, user_id: Optional[int] = None, limit: int = 1000):
+        """Query a user's active topics, or the first `limit` topics by id when no user is given.
+
+        Selects whole rows unless columns are given.
+        """
+        query = db.query(*(entities or (Topic,)))
+        if user_id:
+            return query.filter(
+                and_(Topic.user_id == user_id, Topic.is_active == True)
+            ).order_by(Topic.created_at.desc())
+        return query.order_by(Topic.id.asc()).limit(limit)
 
     def get_by_name(self, db: Session, *, user_id: int, name: str) -> Optional[Topic]:
         return db.query(Topic).filter(
             and_(Topic.user_id == user_id, Topic.name == name)
         ).first()
 
+    def name_exists(self, db: Session, *, user_id: int, name: str) -> bool:
+        return db.query(
+            exists().where(and_(Topic.user_id == user_id, Topic.name == name))
+        ).scalar()
+
+    def get_with_counts(self, db: Session, id: int) -> Optional[tuple]:
+        """Get a topic with its event, article-topic and user-topic counts in one query."""
+        events_count = db.query(func.count(Event.id)).filter(
+            Event.topic_id == Topic.id
+        ).correlate(Topic).scalar_subquery()
+        article_topics_count = db.query(func.count(ArticleTopic.rss_item_id)).filter(
+            ArticleTopic.topic_id == Topic.id
+        ).correlate(Topic).scalar_subquery()
+        user_topics_count = db.query(func.count(UserTopic.user_id)).filter(
+            UserTopic.topic_id == Topic.id
+        ).correlate(Topic).scalar_subquery()
+        
+        return db.query(
+            Topic, events_count, article_topics_count, user_topics_count
+        ).filter(Topic.id == id).first()
+
 
 class CRUDEvent(CRUDBase[Event, dict, dict]):
     def get_topic_events(
@@ -262,6 +343,21 @@ class CRUDEvent(CRUDBase[Event, dict, dict]):
             Event.topic_id == topic_id
         ).order_by(Event.updated_at.desc()).limit(limit).all()
 
+    def get_topic_events_with_article_counts(
+        self, 
+        db: Session, 
+        *, 
+        topic_id: int, 
+        limit: int = 50
+    ) -> List[tuple]:
+        """Get a topic's events paired with their article counts in one query."""
+        article_count = db.query(func.count(ArticleEvent.rss_item_id)).filter(
+            ArticleEvent.event_id == Event.id
+        ).correlate(Event).scalar_subquery()
+        return db.query(Event, article_count).filter(
+            Event.topic_id == topic_id
+        ).order_by(Event.updated_at.desc()).limit(limit).all()
+
     def get_user_recent_events(
         self, 
         db: Session, 
@@ -341,21 +437,34 @@ class CRUDUserSummary(CRUDBase[UserSummary, dict, dict]):
         db: Session, 
         *, 
         user_id: int, 
-        days: int = 30
+        days: int = 30,
+        limit: Optional[int] = None
     ) -> List[UserSummary]:
         cutoff_date = date.today() - timedelta(days=days)
-        return db.query(UserSummary).filter(
+        query = db.query(UserSummary).filter(
             and_(
                 UserSummary.user_id == user_id,
                 UserSummary.date >= cutoff_date
             )
-        ).order_by(UserSummary.date.desc()).all()
+        ).order_by(UserSummary.date.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
 
 class CRUDSystemSetting(CRUDBase[SystemSetting, dict, dict]):
     def get_by_key(self, db: Session, *, key: str) -> Optional[SystemSetting]:
         return db.query(SystemSetting).filter(SystemSetting.setting_key == key).first()
 
+    def get_many_by_keys(self, db: Session, *, keys: List[str]) -> Dict[str, SystemSetting]:
+        """Load several settings in one IN query, keyed by setting_key; missing keys are absent."""
+        if not keys:
+            return {}
+        return {
+            setting.setting_key: setting
+            for setting in db.query(SystemSetting).filter(SystemSetting.setting_key.in_(keys)).all()
+        }
+
     def get_public_settings(self, db: Session) -> List[SystemSetting]:
         return db.query(SystemSetting).filter(SystemSetting.is_public == True).all()
 
@@ -429,6 +538,61 @@ class CRUDSystemSetting(CRUDBase[SystemSetting, dict, dict]):
         
         return setting
 
+    def set_many(
+        self,
+        db: Session,
+        *,
+        items: List[Dict[str, Any]],
+        updated_by: int = None
+    ) -> List[str]:
+        """
+        Create or update several settings and commit them in one transaction.
+        
+        Returns the keys of the settings that were actually created or changed.
+        """
+        # One row per key (the last one wins, as with sequential updates); a single
+        # ON CONFLICT statement may not touch the same row twice
+        rows = {
+            item["setting_key"]: {
+                "setting_key": item["setting_key"],
+                "setting_value": item["setting_value"],
+                "setting_type": item["setting_type"],
+                # New settings should be rare since defaults are pre-populated
+                "description": f"Custom setting: {item['setting_key']}",
+                "is_public": False,
+                "updated_by": updated_by
+            }
+            for item in items
+        }
+        if not rows:
+            return []
+        
+        insert_stmt = pg_insert(SystemSetting).values(list(rows.values()))
+        set_ = {
+            "setting_value": insert_stmt.excluded.setting_value,
+            "setting_type": insert_stmt.excluded.setting_type,
+            "updated_at": func.now()
+        }
+        if updated_by:
+            set_["updated_by"] = insert_stmt.excluded.updated_by
+        
+        # Admin saves resubmit every setting; the WHERE skips rows that would not
+        # change so only real edits are written and get a new updated_at/updated_by
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[SystemSetting.setting_key],
+            set_=set_,
+            where=or_(
+                SystemSetting.setting_value.is_distinct_from(insert_stmt.excluded.setting_value),
+                SystemSetting.setting_type != insert_stmt.excluded.setting_type
+            )
+        ).returning(SystemSetting.setting_key)
+        
+        # Plain keys rather than entities, which would expire on commit and
+        # reload one by one on the caller's first attribute access
+        written_keys = db.scalars(upsert_stmt).all()
+        db.commit()
+        return written_keys
+
 
 class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
     def get_user_subscriptions(self, db: Session, *, user_id: int) -> List[RSSSubscription]:
@@ -437,12 +601,20 @@ class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
             RSSSubscription.user_id == user_id
         ).all()
     
+    def get_user_subscribed_feeds(self, db: Session, *, user_id: int) -> List[RSSFeed]:
+        """Get the feeds a user subscribes to, joined in a single query."""
+        return db.query(RSSFeed).join(
+            RSSSubscription, RSSSubscription.rss_uuid == RSSFeed.uuid
+        ).filter(
+            RSSSubscription.user_id == user_id
+        ).all()
+    
     def get_user_subscription(
         self, 
         db: Session, 
         *, 
         user_id: int, 
-        rss_uuid: str
+        rss_uuid: UUID
     ) -> Optional[RSSSubscription]:
         """Get a specific RSS subscription for a user."""
         return db.query(RSSSubscription).filter(
@@ -457,7 +629,7 @@ class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
         db: Session, 
         *, 
         user_id: int, 
-        rss_uuid: str,
+        rss_uuid: UUID,
         alias: str = None,
         is_active: bool = True
     ) -> RSSSubscription:
@@ -478,7 +650,7 @@ class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
         db: Session,
         *,
         user_id: int,
-        rss_uuid: str,
+        rss_uuid: UUID,
         alias: str = None,
         is_active: bool = None
     ) -> Optional[RSSSubscription]:
@@ -501,7 +673,7 @@ class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
         db: Session,
         *,
         user_id: int,
-        rss_uuid: str
+        rss_uuid: UUID
     ) -> bool:
         """Delete an RSS subscription."""
         subscription = self.get_user_subscription(db, user_id=user_id, rss_uuid=rss_uuid)
@@ -514,6 +686,15 @@ class CRUDRSSSubscription(CRUDBase[RSSSubscription, dict, dict]):
 
 
 class CRUDRSSFetchRecord(CRUDBase[RSSFetchRecord, dict, dict]):
+    def get_feed_uuids(self, db: Session, *, ids: List[int]) -> Dict[int, Any]:
+        """Map fetch record IDs to the UUID of the feed they were fetched from."""
+        if not ids:
+            return {}
+        rows = db.query(RSSFetchRecord.id, RSSFeed.uuid).join(
+            RSSFeed, RSSFeed.id == RSSFetchRecord.rss_feed_id
+        ).filter(RSSFetchRecord.id.in_(ids)).all()
+        return {record_id: feed_uuid for record_id, feed_uuid in rows}
+
     def create_fetch_record(
         self,
         db: Session,
@@ -586,11 +767,19 @@ class CRUDArticleTopic(CRUDBase[ArticleTopic, dict, dict]):
         min_relevance_score: Optional[float] = None,
         max_relevance_score: Optional[float] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        with_related: bool = False
     ) -> List[ArticleTopic]:
-        """Search article-topics with filters."""
+        """Search article-topics with filters.
+        
+        with_related loads each row's topic and rss_item up front (one extra
+        query apiece) instead of lazily per row.
+        """
         query = db.query(ArticleTopic)
         
+        if with_related:
+            query = query.options(selectinload(ArticleTopic.topic), selectinload(ArticleTopic.rss_item))
+        
         if rss_item_id is not None:
             query = query.filter(ArticleTopic.rss_item_id == rss_item_id)
         
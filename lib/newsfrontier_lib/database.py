@@ -2,8 +2,10 @@
 Database connection and session management utilities.
 """
 
+import asyncio
 import os
-from typing import Generator
+import functools
+from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine as sqlalchemy_create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
@@ -37,11 +39,34 @@ def create_session_maker(engine=None):
     
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+@functools.lru_cache(maxsize=1)
+def get_default_session_maker():
+    """Return the process-wide session maker, creating its engine on first use."""
+    # Building an engine per request would also build a fresh connection pool,
+    # so every request paid for a new connection and pooling never kicked in
+    return create_session_maker()
+
 def get_session() -> Generator[Session, None, None]:
     """Dependency function to get database session."""
-    SessionLocal = create_session_maker()
+    SessionLocal = get_default_session_maker()
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_session_async() -> AsyncGenerator[Session, None]:
+    """Async variant of get_session for FastAPI dependencies.
+
+    FastAPI runs sync generator dependencies in its threadpool. Building a
+    Session is in-memory only, since a connection is checked out on first
+    query, so that part runs on the event loop and skips the hop. Closing
+    is different: it rolls back and returns the pooled connection, which is
+    a blocking round-trip, so it is pushed to a worker thread.
+    """
+    SessionLocal = get_default_session_maker()
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        await asyncio.to_thread(db.close)
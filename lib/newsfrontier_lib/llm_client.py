@@ -309,6 +309,48 @@ def generate_content_embedding(title: str, content: str, task_type: str = "RETRI
     return llm_client.generate_embedding(text_for_embedding, task_type=task_type)
 
 
+def normalize_embedding(embedding: List[float]) -> np.ndarray:
+    """Scale an embedding to unit length as float32 so cosine similarity is a plain dot product."""
+    vector = np.array(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def stack_normalized_embeddings(embeddings: List[Any]) -> np.ndarray:
+    """Stack embeddings into a float32 matrix of unit-length rows, computing all norms in one pass."""
+    matrix = np.array(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    # Zero vectors stay zero, as in normalize_embedding
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def encode_embedding(embedding: List[float]) -> str:
+    """Pack an embedding as base64 float16 bytes for transport between services."""
+    return base64.b64encode(np.asarray(embedding, dtype=np.float16).tobytes()).decode("ascii")
+
+
+def decode_embedding(encoded: str) -> np.ndarray:
+    """Unpack an embedding produced by encode_embedding into a float32 array."""
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float16).astype(np.float32)
+
+
+def pack_embedding_matrix(ids: List[int], embeddings: List[Any]) -> bytes:
+    """Pack (id, embedding) rows as int64 ids followed by a row-major float32 matrix."""
+    matrix = np.ascontiguousarray(np.stack(embeddings), dtype=np.float32) if embeddings else np.empty((0, 0), dtype=np.float32)
+    return np.asarray(ids, dtype=np.int64).tobytes() + matrix.tobytes()
+
+
+def unpack_embedding_matrix(body: bytes, count: int, dimensions: int) -> Dict[int, np.ndarray]:
+    """Unpack a pack_embedding_matrix payload into a mapping of id to float32 embedding."""
+    ids = np.frombuffer(body, dtype=np.int64, count=count)
+    matrix = np.frombuffer(body, dtype=np.float32, offset=ids.nbytes).reshape(count, dimensions)
+    return dict(zip(ids.tolist(), matrix))
+
+
 def create_summary(title: str, content: str, prompt_template: str) -> Optional[str]:
     """Create a summary of content using the provided prompt template and summary model."""
     if not content or len(content) < 100:
@@ -60,7 +60,7 @@ class RSSFeed(Base):
     __tablename__ = "rss_feeds"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    uuid: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid_lib.uuid4)
+    uuid: Mapped[uuid_lib.UUID] = mapped_column(UUID(as_uuid=True), unique=True, nullable=False, server_default=func.gen_random_uuid())
     url: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
     title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -109,6 +109,10 @@ class RSSFetchRecord(Base):
     http_status: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     content_encoding: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
+    __table_args__ = (
+        UniqueConstraint("rss_feed_id", "content_hash", name="unique_fetch_record_per_feed_hash"),
+    )
+    
     # Relationships
     rss_feed: Mapped["RSSFeed"] = relationship("RSSFeed", back_populates="fetch_records")
     items_metadata: Mapped[List["RSSItemMetadata"]] = relationship("RSSItemMetadata", back_populates="fetch_record", cascade="all, delete-orphan")
@@ -197,9 +201,10 @@ class Topic(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="topics")
-    events: Mapped[List["Event"]] = relationship("Event", back_populates="topic", cascade="all, delete-orphan")
-    article_topics: Mapped[List["ArticleTopic"]] = relationship("ArticleTopic", back_populates="topic", cascade="all, delete-orphan")
-    user_topics: Mapped[List["UserTopic"]] = relationship("UserTopic", back_populates="topic", cascade="all, delete-orphan")
+    # passive_deletes: the FKs cascade in the database, so deleting a topic doesn't load these first
+    events: Mapped[List["Event"]] = relationship("Event", back_populates="topic", cascade="all, delete-orphan", passive_deletes=True)
+    article_topics: Mapped[List["ArticleTopic"]] = relationship("ArticleTopic", back_populates="topic", cascade="all, delete-orphan", passive_deletes=True)
+    user_topics: Mapped[List["UserTopic"]] = relationship("UserTopic", back_populates="topic", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class ArticleTopic(Base):
@@ -346,14 +351,24 @@ def create_performance_indexes():
         
         # Query performance indexes
         Index('idx_rss_items_processing_status', RSSItemMetadata.processing_status),
-        Index('idx_rss_items_published_at_desc', RSSItemMetadata.published_at.desc()),
+        Index('idx_rss_items_published_at_id', RSSItemMetadata.published_at.desc(),
+              RSSItemMetadata.id.desc()),
+        Index('idx_rss_items_status_created_id', RSSItemMetadata.processing_status,
+              RSSItemMetadata.created_at.desc(), RSSItemMetadata.id.desc()),
+        Index('idx_rss_items_pending_queue', RSSItemMetadata.created_at,
+              postgresql_where=(RSSItemMetadata.processing_status.in_(['pending', 'failed'])) &
+                               (RSSItemMetadata.processing_attempts < 5)),
         Index('idx_rss_item_derivatives_processing_status', RSSItemDerivative.processing_status),
         Index('idx_rss_feeds_last_fetch_status', RSSFeed.last_fetch_status),
         Index('idx_rss_feeds_last_fetch_at', RSSFeed.last_fetch_at),
         Index('idx_topics_user_id_active', Topic.user_id, Topic.is_active),
         Index('idx_events_topic_id_updated', Event.topic_id, Event.updated_at.desc()),
         Index('idx_user_summaries_date_desc', UserSummary.date.desc()),
+        Index('idx_rss_items_created_at_brin', RSSItemMetadata.created_at, postgresql_using='brin'),
+        Index('idx_user_summaries_user_date_nonempty', UserSummary.user_id, UserSummary.date,
+              postgresql_where=(UserSummary.summary.isnot(None)) & (UserSummary.summary != '')),
         Index('idx_article_topics_relevance', ArticleTopic.relevance_score.desc()),
         Index('idx_article_events_relevance', ArticleEvent.relevance_score.desc()),
+        Index('idx_article_events_event_id', ArticleEvent.event_id),
     ]
     return indexes
\ No newline at end of file
@@ -34,7 +34,7 @@ import uvicorn
 
 # Import LLM functionality from shared library
 try:
-    from newsfrontier_lib import get_llm_client, generate_content_embedding, create_summary
+    from newsfrontier_lib import get_llm_client, generate_content_embedding, create_summary, encode_embedding, normalize_embedding, stack_normalized_embeddings, unpack_embedding_matrix
     from newsfrontier_lib.s3_client import get_s3_client, upload_cover_image
     logger = logging.getLogger(__name__)
     logger.info("✅ LLM library imported successfully")
@@ -80,6 +80,8 @@ class AIPostProcessService:
         
         # Topics cache - will be loaded from database each cycle
         self.cached_topics = []
+        # Topics that have vectors, with those vectors stacked as unit-length rows
+        self.topic_matrix = ([], None)
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -127,13 +129,28 @@ class AIPostProcessService:
             logger.warning(f"Error getting system setting '{setting_key}': {e}, using default: {default_value}")
             return default_value
     
+    def fetch_embeddings(self, path: str, params: Dict[str, Any] = None) -> Dict[int, np.ndarray]:
+        """Fetch packed float32 embeddings from an internal endpoint, keyed by row id."""
+        response = requests.get(f"{self.backend_url}{path}", params={**(params or {}), 'format': 'bin'})
+        response.raise_for_status()
+        return unpack_embedding_matrix(
+            response.content,
+            int(response.headers['X-Embedding-Count']),
+            int(response.headers['X-Embedding-Dimensions'])
+        )
+    
     def reload_topics_cache(self):
         """Reload topics cache from database."""
         try:
-            response = requests.get(f"{self.backend_url}/api/internal/topics")
+            # Metadata as JSON, vectors as raw float32 instead of JSON number lists
+            response = requests.get(f"{self.backend_url}/api/internal/topics", params={'include_embeddings': 'false'})
             response.raise_for_status()
             topics = response.json()
+            vectors = self.fetch_embeddings("/api/internal/topics")
+            for topic in topics:
+                topic['topic_vector'] = vectors.get(topic['id'])
             self.cached_topics = topics
+            self.topic_matrix = self.stack_topic_vectors(topics)
             logger.info(f"Loaded {len(topics)} topics into cache")
         except Exception as e:
             logger.warning(f"Failed to reload topics cache: {e}, using existing cache")
@@ -359,6 +376,13 @@ Summary:
             logger.error(f"Error getting topics from cache: {e}")
             return []
 
+    def stack_topic_vectors(self, topics: List[Dict[str, Any]]) -> tuple:
+        """Stack topic vectors into one unit-normalized matrix for batched similarity."""
+        rows = [topic for topic in topics if topic.get('topic_vector') is not None and len(topic['topic_vector']) > 0]
+        if not rows:
+            return [], None
+        return rows, stack_normalized_embeddings([topic['topic_vector'] for topic in rows])
+
     def find_similar_topics(self, title_embedding: List[float] = None, summary_embedding: List[float] = None, article_title: str = "", threshold: float = None) -> List[Dict[str, Any]]:
         """Find topics with cosine similarity above threshold using both title and summary embeddings."""
         try:
@@ -371,70 +395,40 @@ Summary:
                 logger.warning("No embeddings provided for topic similarity comparison")
                 return []
             
-            existing_topics = self.get_existing_topics()
-            similar_topics = []
+            topics, matrix = self.topic_matrix
+            if matrix is None:
+                return []
             
-            if not existing_topics:
-                return similar_topics
+            # Score every topic with one matrix-vector product per embedding
+            title_scores = matrix @ normalize_embedding(title_embedding) if title_embedding else None
+            summary_scores = matrix @ normalize_embedding(summary_embedding) if summary_embedding else None
+            
+            # Use the higher similarity score as the final similarity
+            if title_scores is not None and summary_scores is not None:
+                scores = np.maximum(title_scores, summary_scores)
+                title_higher = title_scores > summary_scores
+            elif title_scores is not None:
+                scores = title_scores
+                title_higher = np.ones(len(topics), dtype=bool)
+            else:
+                scores = summary_scores
+                title_higher = np.zeros(len(topics), dtype=bool)
             
-            # Convert embeddings to numpy arrays if available
-            title_embedding_np = None
-            summary_embedding_np = None
+            # Sort matches by similarity score descending (cosine similarity - higher is better)
+            hits = np.where(scores >= threshold)[0]
+            hits = hits[np.argsort(-scores[hits], kind="stable")]
             
-            if title_embedding:
-                title_embedding_np = np.array(title_embedding).reshape(1, -1)
-            if summary_embedding:
-                summary_embedding_np = np.array(summary_embedding).reshape(1, -1)
+            similar_topics = []
+            for i in hits:
+                topic_copy = topics[i].copy()
+                topic_copy['similarity_score'] = float(scores[i])
+                topic_copy['similarity_source'] = "title" if title_higher[i] else "summary"
+                if title_scores is not None:
+                    topic_copy['title_similarity'] = float(title_scores[i])
+                if summary_scores is not None:
+                    topic_copy['summary_similarity'] = float(summary_scores[i])
+                similar_topics.append(topic_copy)
             
-            for topic in existing_topics:
-                topic_vector = topic.get('topic_vector')
-                if not topic_vector:
-                    continue
-                
-                topic_embedding = np.array(topic_vector).reshape(1, -1)
-                
-                # Calculate similarities for available embeddings
-                title_similarity = None
-                summary_similarity = None
-                
-                if title_embedding_np is not None:
-                    title_similarity = cosine_similarity(title_embedding_np, topic_embedding)[0][0]
-                
-                if summary_embedding_np is not None:
-                    summary_similarity = cosine_similarity(summary_embedding_np, topic_embedding)[0][0]
-
-                final_similarity = 0
-                # Use the higher similarity score as the final similarity
-                if title_similarity is not None and summary_similarity is not None:
-                    final_similarity = max(title_similarity, summary_similarity)
-                    higher_source = "title" if title_similarity > summary_similarity else "summary"
-                elif title_similarity is not None:
-                    final_similarity = title_similarity
-                    higher_source = "title"
-                elif summary_similarity is not None:
-                    final_similarity = summary_similarity
-                    higher_source = "summary"
-                else:
-                    continue  # No valid similarities calculated
-                
-                distance = 1.0 - final_similarity
-                
-                topic_name = topic.get('name', 'Unknown')
-                topic_id = topic.get('id', 'N/A')
-                user_id = topic.get('user_id', 'N/A')
-                
-                if final_similarity >= threshold:
-                    topic_copy = topic.copy()
-                    topic_copy['similarity_score'] = float(final_similarity)
-                    topic_copy['similarity_source'] = higher_source
-                    if title_similarity is not None:
-                        topic_copy['title_similarity'] = float(title_similarity)
-                    if summary_similarity is not None:
-                        topic_copy['summary_similarity'] = float(summary_similarity)
-                    similar_topics.append(topic_copy)
-            
-            # Sort by similarity score descending (cosine similarity - higher is better)
-            similar_topics.sort(key=lambda x: x['similarity_score'], reverse=True)
             # print(f"\n📊 RESULT: Found {len(similar_topics)} matching topics above threshold {threshold}")
             if similar_topics:
                 # print("📋 Matched topics (sorted by relevance):")
@@ -472,14 +466,39 @@ Summary:
             logger.error(f"Failed to create article-topic association: {e}")
             return False
 
+    def create_article_topic_associations(self, article_id: int, topics: List[Dict[str, Any]]) -> bool:
+        """Create associations between an article and several topics in one request."""
+        try:
+            data = [
+                {
+                    'rss_item_id': article_id,
+                    'topic_id': topic['id'],
+                    'relevance_score': topic['similarity_score']
+                }
+                for topic in topics
+            ]
+            
+            response = requests.post(
+                f"{self.backend_url}/api/internal/article-topics/bulk",
+                json=data
+            )
+            response.raise_for_status()
+            
+            logger.info(f"Created {response.json()['created_count']} article-topic associations for article {article_id}")
+            return True
+            
+        except requests.RequestException as e:
+            logger.error(f"Failed to create article-topic associations: {e}")
+            return False
+
     def backfill_existing_articles(self, topic_id: int, topic_embedding: List[float], user_id: int = None, threshold: float = 0.65):
         """Find and associate existing articles with the new topic, generate summaries and create events."""
         try:
             # Get all articles with embeddings that have been completed (have derivatives)
-            response = requests.get(f"{self.backend_url}/api/internal/articles/completed?limit=1000")
+            # The backend streams these as NDJSON, one article per line
+            response = requests.get(f"{self.backend_url}/api/internal/articles/completed?limit=1000", stream=True)
             response.raise_for_status()
-            articles_response = response.json()
-            articles = articles_response.get('data', [])
+            articles = [json.loads(line) for line in response.iter_lines() if line]
             
             if not articles:
                 logger.info("No completed articles found for backfilling")
@@ -635,9 +654,12 @@ Summary:
         """Get existing event clusters for a specific user and topic."""
         try:
             params = {'user_id': user_id, 'topic_id': topic_id}
-            response = requests.get(f"{self.backend_url}/api/internal/events", params=params)
+            response = requests.get(f"{self.backend_url}/api/internal/events", params={**params, 'include_embeddings': 'false'})
             response.raise_for_status()
             events = response.json()
+            embeddings = self.fetch_embeddings("/api/internal/events", params)
+            for event in events:
+                event['event_embedding'] = embeddings.get(event['id'])
             logger.info(f"Found {len(events)} existing event clusters for user {user_id}, topic {topic_id}")
             return events
         except requests.RequestException as e:
@@ -698,37 +720,33 @@ Summary:
                 best_match = None
                 best_similarity = 0.0
                 
-                for event in existing_events:
-                    event_embedding = event.get('event_embedding')
-                    if event_embedding:
-                        try:
-                            # Calculate cosine similarity with both title and summary embeddings
-                            title_similarity = 0.0
-                            summary_similarity = 0.0
-                            
-                            if title_embedding:
-                                title_similarity = cosine_similarity(
-                                    np.array(title_embedding).reshape(1, -1),
-                                    np.array(event_embedding).reshape(1, -1)
-                                )[0][0]
-                            
-                            if summary_embedding:
-                                summary_similarity = cosine_similarity(
-                                    np.array(summary_embedding).reshape(1, -1),
-                                    np.array(event_embedding).reshape(1, -1)
-                                )[0][0]
-                            
-                            # Use the maximum similarity between title and summary
-                            similarity = max(title_similarity, summary_similarity)
-                            
-                            logger.debug(f"Event {event['id']} - title_sim: {title_similarity:.3f}, summary_sim: {summary_similarity:.3f}, max_sim: {similarity:.3f}")
+                events_with_embeddings = [
+                    event for event in existing_events
+                    if event.get('event_embedding') is not None and len(event['event_embedding']) > 0
+                ]
+                if events_with_embeddings:
+                    try:
+                        # Stack the event embeddings once and score them all with one
+                        # matrix-vector product per article embedding
+                        event_matrix = stack_normalized_embeddings([event['event_embedding'] for event in events_with_embeddings])
+                        no_scores = np.zeros(len(events_with_embeddings), dtype=np.float32)
+                        title_similarities = event_matrix @ normalize_embedding(title_embedding) if title_embedding else no_scores
+                        summary_similarities = event_matrix @ normalize_embedding(summary_embedding) if summary_embedding else no_scores
+                        
+                        # Use the maximum similarity between title and summary
+                        similarities = np.maximum(title_similarities, summary_similarities)
+                        
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for event, title_similarity, summary_similarity, similarity in zip(events_with_embeddings, title_similarities, summary_similarities, similarities):
+                                logger.debug(f"Event {event['id']} - title_sim: {title_similarity:.3f}, summary_sim: {summary_similarity:.3f}, max_sim: {similarity:.3f}")
+                        
+                        best_index = int(np.argmax(similarities))
+                        if similarities[best_index] > best_similarity:
+                            best_similarity = float(similarities[best_index])
+                            best_match = events_with_embeddings[best_index]
                             
-                            if similarity > best_similarity:
-                                best_similarity = similarity
-                                best_match = event
-                                
-                        except Exception as e:
-                            logger.warning(f"Failed to calculate similarity for event {event['id']}: {e}")
+                    except Exception as e:
+                        logger.warning(f"Failed to calculate event similarities: {e}")
                 
                 # If similarity >= threshold, assign directly without LLM
                 if best_match and best_similarity >= self.cluster_threshold:
@@ -871,8 +889,8 @@ Summary:
         """Update article with processing results via backend API."""
         try:
             data = {
-                'title_embedding': title_embedding,
-                'summary_embedding': summary_embedding,
+                'title_embedding_b64': encode_embedding(title_embedding) if title_embedding else None,
+                'summary_embedding_b64': encode_embedding(summary_embedding) if summary_embedding else None,
                 'embedding_model': self.llm_client.embedding_model,
                 'summary': summary,
                 'summary_model': self.llm_client.default_chat_model,
@@ -944,10 +962,7 @@ Summary:
                     logger.info(f"Found {len(similar_topics)} similar topics for article {article_id}")
                     
                     # Create associations with similar topics
-                    for topic in similar_topics:
-                        self.create_article_topic_association(
-                            article_id, topic['id'], topic['similarity_score']
-                        )
+                    self.create_article_topic_associations(article_id, similar_topics)
                     
                     # Perform clustering for each user/topic combination if summary exists
                     if summary:
@@ -1153,7 +1168,7 @@ Summary:
             user_data = user_response.json()
             
             # Get user's topics
-            topics_response = requests.get(f"{self.backend_url}/api/internal/topics?user_id={user_id}")
+            topics_response = requests.get(f"{self.backend_url}/api/internal/topics?user_id={user_id}&include_embeddings=false")
             topics_response.raise_for_status()
             user_topics = topics_response.json()  # Returns list directly
             
@@ -1175,7 +1190,7 @@ Summary:
             new_events = []
             for topic in user_topics:
                 events_response = requests.get(
-                    f"{self.backend_url}/api/internal/events?topic_id={topic['id']}&created_date={date}"
+                    f"{self.backend_url}/api/internal/events?topic_id={topic['id']}&created_date={date}&include_embeddings=false"
                 )
                 if events_response.status_code == 200:
                     topic_events = events_response.json()  # Returns list directly
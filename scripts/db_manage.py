@@ -234,5 +234,82 @@ def reset(ctx, tables, confirm):
     finally:
         conn.close()
 
+# Adds the (rss_feed_id, content_hash) uniqueness that the fetch-record upsert
+# conflicts on. Databases created before init.sql declared it can already hold
+# duplicates, so those are merged into the oldest record first: its articles are
+# moved over unless the survivor already has the same guid, and the remaining
+# copies are deleted.
+FETCH_RECORD_UNIQUE_MIGRATION = """
+LOCK TABLE rss_fetch_records IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TEMP TABLE fetch_record_dupes ON COMMIT DROP AS
+SELECT id, keep_id FROM (
+    SELECT id, min(id) OVER (PARTITION BY rss_feed_id, content_hash) AS keep_id
+    FROM rss_fetch_records
+    WHERE rss_feed_id IS NOT NULL
+) ranked
+WHERE id <> keep_id;
+
+WITH candidates AS (
+    SELECT m.id, d.keep_id, m.guid,
+           row_number() OVER (PARTITION BY d.keep_id, m.guid ORDER BY m.id) AS rn
+    FROM rss_items_metadata m
+    JOIN fetch_record_dupes d ON d.id = m.rss_fetch_record_id
+)
+UPDATE rss_items_metadata m
+SET rss_fetch_record_id = c.keep_id
+FROM candidates c
+WHERE m.id = c.id
+  AND (c.guid IS NULL OR (c.rn = 1 AND NOT EXISTS (
+      SELECT 1 FROM rss_items_metadata k
+      WHERE k.rss_fetch_record_id = c.keep_id AND k.guid = c.guid
+  )));
+
+UPDATE rss_fetch_records r
+SET first_fetch_timestamp = LEAST(r.first_fetch_timestamp, agg.first_fetch),
+    last_fetch_timestamp = GREATEST(r.last_fetch_timestamp, agg.last_fetch)
+FROM (
+    SELECT d.keep_id,
+           min(f.first_fetch_timestamp) AS first_fetch,
+           max(f.last_fetch_timestamp) AS last_fetch
+    FROM fetch_record_dupes d
+    JOIN rss_fetch_records f ON f.id = d.id
+    GROUP BY d.keep_id
+) agg
+WHERE r.id = agg.keep_id;
+
+DELETE FROM rss_fetch_records r
+USING fetch_record_dupes d
+WHERE r.id = d.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS unique_fetch_record_per_feed_hash
+    ON rss_fetch_records (rss_feed_id, content_hash);
+"""
+
+@cli.command()
+@click.pass_context
+def migrate(ctx):
+    """Bring an existing database up to the current schema."""
+    conn_params = ctx.obj['conn_params']
+    
+    conn = get_connection(conn_params)
+    if not conn:
+        sys.exit(1)
+    
+    try:
+        cur = conn.cursor()
+        
+        print(f"{Fore.BLUE}🔧 Enforcing unique fetch records per feed and content hash...{Style.RESET_ALL}")
+        cur.execute(FETCH_RECORD_UNIQUE_MIGRATION)
+        conn.commit()
+        print(f"{Fore.GREEN}✅ Migration completed successfully{Style.RESET_ALL}")
+        
+    except psycopg2.Error as e:
+        conn.rollback()
+        print(f"{Fore.RED}❌ Migration failed: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file